@@ -25,6 +25,7 @@ import os
 import pyqtgraph as pg
 import time
 
+from core.configoption import ConfigOption
 from core.connector import Connector
 from gui.colordefs import QudiPalettePale as palette
 from gui.guibase import GUIBase
@@ -69,6 +70,9 @@ class LaserGUI(GUIBase):
     ## declare connectors
     laserlogic = Connector(interface='LaserLogic')
 
+    # minimum time between two GUI refreshes in ms
+    _update_interval = ConfigOption('update_interval', 40)
+
     sigLaser = QtCore.Signal(bool)
     sigShutter = QtCore.Signal(bool)
     sigPower = QtCore.Signal(float)
@@ -113,6 +117,9 @@ class LaserGUI(GUIBase):
         for name in self._laser_logic.data:
             if name != 'time':
                 curve = pg.PlotDataItem()
+                # the logic keeps a long history buffer, only draw what can be resolved on screen
+                curve.setDownsampling(auto=True, method='peak')
+                curve.setClipToView(True)
                 if name == 'power':
                     curve.setPen(palette.c1)
                     plot1.addItem(curve)
@@ -130,19 +137,41 @@ class LaserGUI(GUIBase):
         self.updateButtonsEnabled()
         self._mw.laserButton.clicked.connect(self.changeLaserState)
         self._mw.shutterButton.clicked.connect(self.changeShutterState)
-        self.sigLaser.connect(self._laser_logic.set_laser_state)
-        self.sigShutter.connect(self._laser_logic.set_shutter_state)
-        self.sigCurrent.connect(self._laser_logic.set_current)
-        self.sigPower.connect(self._laser_logic.set_power)
-        self.sigCtrlMode.connect(self._laser_logic.set_control_mode)
+        self.sigLaser.connect(self._laser_logic.set_laser_state, QtCore.Qt.QueuedConnection)
+        self.sigShutter.connect(self._laser_logic.set_shutter_state, QtCore.Qt.QueuedConnection)
+        self.sigCurrent.connect(self._laser_logic.set_current, QtCore.Qt.QueuedConnection)
+        self.sigPower.connect(self._laser_logic.set_power, QtCore.Qt.QueuedConnection)
+        self.sigCtrlMode.connect(self._laser_logic.set_control_mode, QtCore.Qt.QueuedConnection)
         self._mw.controlModeButtonGroup.buttonClicked.connect(self.changeControlMode)
         self.sliderProxy = pg.SignalProxy(self._mw.setValueVerticalSlider.valueChanged, 0.1, 5, self.updateFromSlider)
         self._mw.setValueDoubleSpinBox.editingFinished.connect(self.updateFromSpinBox)
-        self._laser_logic.sigUpdate.connect(self.updateGui)
+
+        # coalesce logic updates arriving faster than the GUI needs to be redrawn
+        self._update_timer = QtCore.QTimer()
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self._update_interval)
+        self._update_timer.timeout.connect(self.updateGui)
+        self._laser_logic.sigUpdate.connect(self.scheduleUpdate, QtCore.Qt.QueuedConnection)
 
     def on_deactivate(self):
         """ Deactivate the module properly.
         """
+        # disconnect signals
+        self._laser_logic.sigUpdate.disconnect(self.scheduleUpdate)
+        self._update_timer.stop()
+        self._update_timer.timeout.disconnect()
+        self.sliderProxy.disconnect()
+        self._mw.setValueDoubleSpinBox.editingFinished.disconnect()
+        self._mw.controlModeButtonGroup.buttonClicked.disconnect()
+        self._mw.laserButton.clicked.disconnect()
+        self._mw.shutterButton.clicked.disconnect()
+        self._mw.actionReset_View.triggered.disconnect()
+        self.plot1.vb.sigResized.disconnect(self.updateViews)
+        self.sigLaser.disconnect()
+        self.sigShutter.disconnect()
+        self.sigCurrent.disconnect()
+        self.sigPower.disconnect()
+        self.sigCtrlMode.disconnect()
         self._mw.close()
 
     def show(self):
@@ -200,19 +229,23 @@ class LaserGUI(GUIBase):
         pwr = self._mw.powerRadioButton.isChecked() and self._mw.powerRadioButton.isEnabled()
         if pwr and not cur:
             lpr = self._laser_logic.laser_power_range
+            setpoint = self._laser_logic.laser_power_setpoint
             self._mw.setValueDoubleSpinBox.setRange(lpr[0], lpr[1])
-            self._mw.setValueDoubleSpinBox.setValue(self._laser_logic.laser_power_setpoint)
+            self._mw.setValueDoubleSpinBox.setValue(setpoint)
             self._mw.setValueDoubleSpinBox.setSuffix('W')
-            self._mw.setValueVerticalSlider.setValue(
-                self._laser_logic.laser_power_setpoint / (lpr[1] - lpr[0]) * 100 - lpr[0])
+            self._mw.setValueVerticalSlider.blockSignals(True)
+            self._mw.setValueVerticalSlider.setValue(setpoint / (lpr[1] - lpr[0]) * 100 - lpr[0])
+            self._mw.setValueVerticalSlider.blockSignals(False)
             self.sigCtrlMode.emit(ControlMode.POWER)
         elif cur and not pwr:
             lcr = self._laser_logic.laser_current_range
+            setpoint = self._laser_logic.laser_current_setpoint
             self._mw.setValueDoubleSpinBox.setRange(lcr[0], lcr[1])
-            self._mw.setValueDoubleSpinBox.setValue(self._laser_logic.laser_current_setpoint)
+            self._mw.setValueDoubleSpinBox.setValue(setpoint)
             self._mw.setValueDoubleSpinBox.setSuffix('%')
-            self._mw.setValueVerticalSlider.setValue(
-                self._laser_logic.laser_current_setpoint / (lcr[1] - lcr[0]) * 100 - lcr[0])
+            self._mw.setValueVerticalSlider.blockSignals(True)
+            self._mw.setValueVerticalSlider.setValue(setpoint / (lcr[1] - lcr[0]) * 100 - lcr[0])
+            self._mw.setValueVerticalSlider.blockSignals(False)
             self.sigCtrlMode.emit(ControlMode.CURRENT)
         else:
             self.log.error('How did you mess up the radio button group?')
@@ -221,24 +254,26 @@ class LaserGUI(GUIBase):
     def updateButtonsEnabled(self):
         """ Logic told us to update our button states, so set the buttons accordingly. """
         self._mw.laserButton.setEnabled(self._laser_logic.laser_can_turn_on)
-        if self._laser_logic.laser_state == LaserState.ON:
+        laser_state = self._laser_logic.laser_state
+        if laser_state == LaserState.ON:
             self._mw.laserButton.setText('Laser: ON')
             self._mw.laserButton.setChecked(True)
             self._mw.laserButton.setStyleSheet('')
-        elif self._laser_logic.laser_state == LaserState.OFF:
+        elif laser_state == LaserState.OFF:
             self._mw.laserButton.setText('Laser: OFF')
             self._mw.laserButton.setChecked(False)
-        elif self._laser_logic.laser_state == LaserState.LOCKED:
+        elif laser_state == LaserState.LOCKED:
             self._mw.laserButton.setText('INTERLOCK')
         else:
             self._mw.laserButton.setText('Laser: ?')
 
         self._mw.shutterButton.setEnabled(self._laser_logic.has_shutter)
-        if self._laser_logic.laser_shutter == ShutterState.OPEN:
+        laser_shutter = self._laser_logic.laser_shutter
+        if laser_shutter == ShutterState.OPEN:
             self._mw.shutterButton.setText('Shutter: OPEN')
-        elif self._laser_logic.laser_shutter == ShutterState.CLOSED:
+        elif laser_shutter == ShutterState.CLOSED:
             self._mw.shutterButton.setText('Shutter: CLOSED')
-        elif self._laser_logic.laser_shutter == ShutterState.NOSHUTTER:
+        elif laser_shutter == ShutterState.NOSHUTTER:
             self._mw.shutterButton.setText('No shutter.')
         else:
             self._mw.shutterButton.setText('Shutter: ?')
@@ -246,23 +281,34 @@ class LaserGUI(GUIBase):
         self._mw.currentRadioButton.setEnabled(self._laser_logic.laser_can_current)
         self._mw.powerRadioButton.setEnabled(self._laser_logic.laser_can_power)
 
+    @QtCore.Slot()
+    def scheduleUpdate(self):
+        """ Logic has new data, redraw once the update interval has passed. """
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
     @QtCore.Slot()
     def updateGui(self):
         """ Update labels, the plot and button states with new data. """
+        laser_logic = self._laser_logic
         self._mw.currentLabel.setText(
-            '{0:6.3f} {1}'.format(
-                self._laser_logic.laser_current,
-                self._laser_logic.laser_current_unit))
-        self._mw.powerLabel.setText('{0:6.3f} W'.format(self._laser_logic.laser_power))
-        self._mw.extraLabel.setText(self._laser_logic.laser_extra)
+            '{0:6.3f} {1}'.format(laser_logic.laser_current, laser_logic.laser_current_unit))
+        self._mw.powerLabel.setText('{0:6.3f} W'.format(laser_logic.laser_power))
+        self._mw.extraLabel.setText(laser_logic.laser_extra)
         self.updateButtonsEnabled()
+
+        data = laser_logic.data
+        time_data = data['time']
         for name, curve in self.curves.items():
-            curve.setData(x=self._laser_logic.data['time'], y=self._laser_logic.data[name])
+            curve.setData(x=time_data, y=data[name])
 
     @QtCore.Slot()
     def updateFromSpinBox(self):
         """ The user has changed the spinbox, update all other values from that. """
+        # Block the slider so its signal proxy does not emit the setpoint a second time
+        self._mw.setValueVerticalSlider.blockSignals(True)
         self._mw.setValueVerticalSlider.setValue(self._mw.setValueDoubleSpinBox.value())
+        self._mw.setValueVerticalSlider.blockSignals(False)
         cur = self._mw.currentRadioButton.isChecked() and self._mw.currentRadioButton.isEnabled()
         pwr = self._mw.powerRadioButton.isChecked() and  self._mw.powerRadioButton.isEnabled()
         if pwr and not cur:
@@ -277,10 +323,9 @@ class LaserGUI(GUIBase):
         pwr = self._mw.powerRadioButton.isChecked() and self._mw.powerRadioButton.isEnabled()
         if pwr and not cur:
             lpr = self._laser_logic.laser_power_range
-            self._mw.setValueDoubleSpinBox.setValue(
-                lpr[0] + self._mw.setValueVerticalSlider.value() / 100 * (lpr[1] - lpr[0]))
-            self.sigPower.emit(
-                lpr[0] + self._mw.setValueVerticalSlider.value() / 100 * (lpr[1] - lpr[0]))
+            power = lpr[0] + self._mw.setValueVerticalSlider.value() / 100 * (lpr[1] - lpr[0])
+            self._mw.setValueDoubleSpinBox.setValue(power)
+            self.sigPower.emit(power)
         elif cur and not pwr:
             self._mw.setValueDoubleSpinBox.setValue(self._mw.setValueVerticalSlider.value())
             self.sigCurrent.emit(self._mw.setValueDoubleSpinBox.value())
@@ -24,6 +24,7 @@ import pyqtgraph as pg
 import numpy as np
 
 from core.connector import Connector
+from core.configoption import ConfigOption
 from core.util import units
 from gui.guibase import GUIBase
 from gui.colordefs import ColorScaleInferno
@@ -31,6 +32,7 @@ from gui.colordefs import QudiPalettePale as palette
 from gui.fitsettings import FitSettingsDialog, FitSettingsComboBox
 from qtpy import QtCore, QtWidgets, uic
 from core.util.helpers import natural_sort
+from functools import partial
 from qtwidgets.scientific_spinbox import ScienDSpinBox, ScienSpinBox
 from qtwidgets.loading_indicator import CircleLoadingIndicator
 
@@ -43,6 +45,12 @@ from enum import Enum
 
 import time
 
+# unit suffix of a float method parameter, picked from the first matching part of its name
+_SUFFIX_RULES = ((('amp', 'volt'), 'V'),
+                 (('freq',), 'Hz'),
+                 (('time', 'period', 'tau'), 's'))
+
+
 class CameraSettingDialog(QtWidgets.QDialog):
     """ Create the SettingsDialog window, based on the corresponding *.ui file."""
 
@@ -72,6 +80,8 @@ class WidefieldWindow(QtWidgets.QMainWindow):
     """ Class defined for the main window (not the module)
 
     """
+    # emitted when the window becomes visible again after being hidden or minimized
+    sigWindowRestored = QtCore.Signal()
 
     def __init__(self):
         # Get the path to the *.ui file
@@ -83,6 +93,15 @@ class WidefieldWindow(QtWidgets.QMainWindow):
         uic.loadUi(ui_file, self)
         self.show()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.sigWindowRestored.emit()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange and not self.isMinimized():
+            self.sigWindowRestored.emit()
+
 
 class WidefieldGUI(GUIBase):
     """ Main spectrometer camera class.
@@ -92,6 +111,16 @@ class WidefieldGUI(GUIBase):
     widefieldlogic1 = Connector(interface='WidefieldMeasurementLogic')
     savelogic = Connector(interface='SaveLogic')
 
+    # render the camera image and the ODMR plot through OpenGL
+    _use_opengl = ConfigOption('use_opengl', default=False)
+
+    # number of pixels sampled when estimating the colorbar percentiles
+    _centile_samples = 10000
+    # delay in ms after the last camera or sweep setting edit before the settings are sent
+    _params_delay = 50
+    # minimum time in ms between two drawn camera frames (~30 frames per second)
+    _render_interval = 33
+
 
     # Camera Signals
     sigVideoStart = QtCore.Signal()
@@ -144,6 +173,13 @@ class WidefieldGUI(GUIBase):
         self._mw = WidefieldWindow()
         self.restoreWindowPos(self._mw)
 
+        # Only the busy live views get an OpenGL viewport, the global pyqtgraph setting is left alone.
+        if self._use_opengl:
+            for plot_widget in (self._mw.image_PlotWidget,
+                                self._mw.image_fit_PlotWidget,
+                                self._mw.odmr_PlotWidget):
+                plot_widget.useOpenGL(True)
+
         self.initSettingsUI()
         self.initChannelSettingsUI()
 
@@ -152,9 +188,11 @@ class WidefieldGUI(GUIBase):
         self.mwsettings.setValue("geometry", self._mw.saveGeometry())
         self.mwsettings.setValue("windowState", self._mw.saveState())
 
-        # Get hardware constraints to set limits for input widgets
-        # constraints = self._widefield_logic.get_hw_constraints()
-        mw1_constraints = self._widefield_logic.ext_microwave1_constraints
+        # Get hardware constraints to set limits for input widgets. They are fixed while the
+        # module is active, so keep them instead of querying the logic again for every range row.
+        self._hw_constraints = self._widefield_logic.get_hw_constraints()
+        self._mw1_constraints = self._widefield_logic.ext_microwave1_constraints
+        mw1_constraints = self._mw1_constraints
         mw2_constraints = self._widefield_logic.ext_microwave2_constraints
 
         # Adjust range of scientific spinboxes above what is possible in Qt Designer
@@ -245,27 +283,15 @@ class WidefieldGUI(GUIBase):
         # Append three data structs to odmr image for 3 curves 
         self.odmr_image = []
 
-        self.odmr_image.append(pg.PlotDataItem(pen=pg.mkPen(palette.c1, style=QtCore.Qt.DotLine),
-                                          symbol='o',
-                                          symbolPen=palette.c1,
-                                          symbolBrush=palette.c1,
-                                          symbolSize=7))
-        self._mw.odmr_PlotWidget.addItem(self.odmr_image[-1])
-
-        self.odmr_image.append(pg.PlotDataItem(pen=pg.mkPen(palette.c3, style=QtCore.Qt.DotLine),
-                                          symbol='o',
-                                          symbolPen=palette.c3,
-                                          symbolBrush=palette.c3,
-                                          symbolSize=7))
-        self._mw.odmr_PlotWidget.addItem(self.odmr_image[-1])
-
-        self.odmr_image.append(pg.PlotDataItem(pen=pg.mkPen(palette.c4, style=QtCore.Qt.DotLine),
-                                          symbol='o',
-                                          symbolPen=palette.c4,
-                                          symbolBrush=palette.c4,
-                                          symbolSize=7))
-        self._mw.odmr_PlotWidget.addItem(self.odmr_image[-1])
-
+        for color in (palette.c1, palette.c3, palette.c4):
+            self.odmr_image.append(pg.PlotDataItem(pen=pg.mkPen(color, style=QtCore.Qt.DotLine),
+                                                   symbol='o',
+                                                   symbolPen=color,
+                                                   symbolBrush=color,
+                                                   symbolSize=7))
+            self._mw.odmr_PlotWidget.addItem(self.odmr_image[-1])
+        # the second and third curve are only used for multi-frequency measurements
+        self._extra_curves_shown = False
 
         self.odmr_fit_image = pg.PlotDataItem(self._widefield_logic.odmr_fit_x,
                                               self._widefield_logic.odmr_fit_y,
@@ -279,12 +305,19 @@ class WidefieldGUI(GUIBase):
 
         # Get the colorscales at set LUT
         self.my_colors = ColorScaleInferno()
+        # A 256 entry table lets pyqtgraph rescale the camera frames straight
+        # into an uint8 index array instead of an uint16 one for the 2000 entry
+        # default LUT, which halves the memory traffic of every displayed frame.
+        # The colormap is fully opaque, so leaving out the alpha channel makes
+        # pyqtgraph hand an RGB32 instead of an ARGB32 QImage to the painter.
+        self._display_lut = self.my_colors.colormap.getLookupTable(0, 1, 256, alpha=False)
 
         ########################################################################
         #                  Configuration of the Colorbar                       #
         ########################################################################
         # create color bar
         self.xy_cb = ColorBar(self.my_colors.cmap_normed, width=100, cb_min=0, cb_max=100)
+        self._xy_cb_range = [0, 100]
 
         self._mw.xy_cb_PlotWidget.addItem(self.xy_cb)
         self._mw.xy_cb_PlotWidget.hideAxis('bottom')
@@ -296,6 +329,7 @@ class WidefieldGUI(GUIBase):
         ########################################################################
         # create color bar
         self.fit_xy_cb = ColorBar(self.my_colors.cmap_normed, width=100, cb_min=0, cb_max=100)
+        self._fit_xy_cb_range = [0, 100]
 
         self._mw.fit_xy_cb_PlotWidget.addItem(self.fit_xy_cb)
         self._mw.fit_xy_cb_PlotWidget.hideAxis('bottom')
@@ -315,8 +349,10 @@ class WidefieldGUI(GUIBase):
         # self._mw.sweep_power_DoubleSpinBox.setValue(self._widefield_logic.sweep_mw_power)
 
         self._mw.runtime_DoubleSpinBox.setValue(self._widefield_logic.run_time)
-        self._mw.elapsed_time_lcd.display(int(np.rint(self._widefield_logic.elapsed_time)))
-        self._mw.elapsed_sweeps_lcd.display(self._widefield_logic.elapsed_sweeps)
+        self._displayed_elapsed_time = int(round(self._widefield_logic.elapsed_time))
+        self._displayed_elapsed_sweeps = self._widefield_logic.elapsed_sweeps
+        self._mw.elapsed_time_lcd.display(self._displayed_elapsed_time)
+        self._mw.elapsed_sweeps_lcd.display(self._displayed_elapsed_sweeps)
         self._mw.autosave_num_spinBox.setValue(self._widefield_logic.autosave_num)
 
         self._sd.frame_rate_DoubleSpinBox.setValue(self._widefield_logic.frame_rate)
@@ -330,14 +366,12 @@ class WidefieldGUI(GUIBase):
         self._mw.triggerMode_checkBox.setChecked(self._widefield_logic.trigger_mode)
 
         self._mw.exposuremode_comboBox.clear()
-        for mode in self._widefield_logic.exposure_modes:
-            self._mw.exposuremode_comboBox.addItem(mode)
+        self._mw.exposuremode_comboBox.addItems(list(self._widefield_logic.exposure_modes))
         self._mw.exposuremode_comboBox.setCurrentText(self._widefield_logic.exposure_mode)
 
         self._mw.measurement_type_comboBox.clear()
-        for mode in self._widefield_logic.predefined_generate_methods:
-            if "WF_" in mode:
-                self._mw.measurement_type_comboBox.addItem(mode)
+        self._mw.measurement_type_comboBox.addItems(
+            [mode for mode in self._widefield_logic.predefined_generate_methods if "WF_" in mode])
         self._mw.measurement_type_comboBox.setCurrentText(self._widefield_logic.measurement_type)
 
         self._mw.exposureDSpinBox.setValue(self._widefield_logic.exposure_time)
@@ -347,8 +381,7 @@ class WidefieldGUI(GUIBase):
         self._mw.offset_y_spinBox.setValue(self._widefield_logic.offset_y)
 
         self._mw.pixel_format_comboBox.clear()
-        for mode in self._widefield_logic.pixel_formats:
-            self._mw.pixel_format_comboBox.addItem(mode)
+        self._mw.pixel_format_comboBox.addItems(list(self._widefield_logic.pixel_formats))
         self._mw.pixel_format_comboBox.setCurrentText(self._widefield_logic.pixel_format)
 
         self._mw.plot_pixel_x_spinBox.setValue(self._widefield_logic.plot_pixel_x)
@@ -362,6 +395,46 @@ class WidefieldGUI(GUIBase):
         self._fsd.applySettings()
         self._mw.action_Fit_Settings.triggered.connect(self._fsd.show)
 
+        # Widget groups that are locked together while a measurement is running
+        self._camera_setting_widgets = (self._mw.gainSpinBox,
+                                        self._mw.triggerMode_checkBox,
+                                        self._mw.exposuremode_comboBox,
+                                        self._mw.exposureDSpinBox,
+                                        self._mw.x_pixels_SpinBox,
+                                        self._mw.y_pixels_SpinBox,
+                                        self._mw.offset_x_spinBox,
+                                        self._mw.offset_y_spinBox,
+                                        self._mw.pixel_format_comboBox,
+                                        self._mw.plot_pixel_x_spinBox,
+                                        self._mw.plot_pixel_y_spinBox)
+        self._device_widgets = (self._mw.pulser_on_off_PushButton,
+                                self._mw.clear_device_PushButton,
+                                self._mw.plot_seq_PushButton,
+                                self._mw.ext_control_use_mw1_CheckBox,
+                                self._mw.ext_control_mw1_freq_DoubleSpinBox,
+                                self._mw.ext_control_mw1_power_DoubleSpinBox,
+                                self._mw.ext_control_use_mw2_CheckBox,
+                                self._mw.ext_control_mw2_freq_DoubleSpinBox,
+                                self._mw.ext_control_mw2_power_DoubleSpinBox)
+        self._scan_setting_widgets = (self._mw.runtime_DoubleSpinBox,
+                                      self._mw.autosave_num_spinBox,
+                                      self._sd.frame_rate_DoubleSpinBox)
+
+        # Widget setters used by update_parameter, keyed by the logic's parameter names
+        self._range_params = {'mw_starts': 'start', 'mw_steps': 'step', 'mw_stops': 'stop'}
+        self._param_setters = {
+            'run_time': (self._mw.runtime_DoubleSpinBox.setValue,),
+            'autosave_num': (self._mw.autosave_num_spinBox.setValue,),
+            'frame_rate': (self._sd.frame_rate_DoubleSpinBox.setValue,),
+            'gain': (self._mw.gainSpinBox.setValue,),
+            'trigger_mode': (self._mw.triggerMode_checkBox.setChecked,),
+            'exposure_mode': (self._mw.exposuremode_comboBox.setCurrentText,),
+            'exposure_time': (self._mw.exposureDSpinBox.setValue,),
+            'image_size': (self._mw.x_pixels_SpinBox.setValue, self._mw.y_pixels_SpinBox.setValue),
+            'image_offset': (self._mw.offset_x_spinBox.setValue, self._mw.offset_y_spinBox.setValue),
+            'pixel_format': (self._mw.pixel_format_comboBox.setCurrentText,),
+            'plot_pixel': (self._mw.plot_pixel_x_spinBox.setValue, self._mw.plot_pixel_y_spinBox.setValue)}
+
         ########################################################################
         #                       Connect signals                                #
         ########################################################################
@@ -371,17 +444,28 @@ class WidefieldGUI(GUIBase):
         self._mw.update_from_cam_PushButton.clicked.connect(self.update_from_cam)
         self._mw.cam_connect_RadioButton.clicked.connect(self.toggle_cam_connect)
 
-        self._mw.gainSpinBox.editingFinished.connect(self.change_camera_params)
-        self._mw.triggerMode_checkBox.stateChanged.connect(self.change_camera_params)
-        self._mw.exposuremode_comboBox.currentTextChanged.connect(self.change_camera_params)
-        self._mw.exposureDSpinBox.editingFinished.connect(self.change_camera_params)
-        self._mw.x_pixels_SpinBox.editingFinished.connect(self.change_camera_params)
-        self._mw.y_pixels_SpinBox.editingFinished.connect(self.change_camera_params)
-        self._mw.offset_x_spinBox.editingFinished.connect(self.change_camera_params)
-        self._mw.offset_y_spinBox.editingFinished.connect(self.change_camera_params)
-        self._mw.pixel_format_comboBox.currentTextChanged.connect(self.change_camera_params)
-        self._mw.plot_pixel_x_spinBox.editingFinished.connect(self.change_camera_params)
-        self._mw.plot_pixel_y_spinBox.editingFinished.connect(self.change_camera_params)
+        # Bursts of camera setting edits are collapsed into a single reconfiguration of the camera
+        self._cam_params_timer = QtCore.QTimer(self._mw)
+        self._cam_params_timer.setSingleShot(True)
+        self._cam_params_timer.setInterval(self._params_delay)
+        self._cam_params_timer.timeout.connect(self.change_camera_params)
+        # Same for edits of the frequency ranges, e.g. tabbing through a row of spinboxes
+        self._sweep_params_timer = QtCore.QTimer(self._mw)
+        self._sweep_params_timer.setSingleShot(True)
+        self._sweep_params_timer.setInterval(self._params_delay)
+        self._sweep_params_timer.timeout.connect(self.change_sweep_params)
+
+        self._mw.gainSpinBox.editingFinished.connect(self.schedule_camera_params)
+        self._mw.triggerMode_checkBox.stateChanged.connect(self.schedule_camera_params)
+        self._mw.exposuremode_comboBox.currentTextChanged.connect(self.schedule_camera_params)
+        self._mw.exposureDSpinBox.editingFinished.connect(self.schedule_camera_params)
+        self._mw.x_pixels_SpinBox.editingFinished.connect(self.schedule_camera_params)
+        self._mw.y_pixels_SpinBox.editingFinished.connect(self.schedule_camera_params)
+        self._mw.offset_x_spinBox.editingFinished.connect(self.schedule_camera_params)
+        self._mw.offset_y_spinBox.editingFinished.connect(self.schedule_camera_params)
+        self._mw.pixel_format_comboBox.currentTextChanged.connect(self.schedule_camera_params)
+        self._mw.plot_pixel_x_spinBox.editingFinished.connect(self.schedule_camera_params)
+        self._mw.plot_pixel_y_spinBox.editingFinished.connect(self.schedule_camera_params)
 
         # self._mw.sweep_power_DoubleSpinBox.editingFinished.connect(self.change_sweep_params)
         # self._mw.cw_power_DoubleSpinBox.editingFinished.connect(self.change_cw_params)
@@ -516,6 +600,14 @@ class WidefieldGUI(GUIBase):
         self._mw.start_image_Action.setChecked(self._camera_logic.enabled)
         self._mw.start_image_Action.triggered.connect(self.start_image_clicked)
 
+        self._image_pending = False
+        self._pending_plots = None
+        # Frames arriving faster than the GUI can draw them are coalesced, only the newest is drawn
+        self._render_timer = QtCore.QTimer(self._mw)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self._render_interval)
+        self._render_timer.timeout.connect(self._render_frame)
+        self._mw.sigWindowRestored.connect(self._flush_pending_display)
         self._camera_logic.sigUpdateDisplay.connect(self.update_data)
         self._camera_logic.sigAcquisitionFinished.connect(self.acquisition_finished)
         self._camera_logic.sigVideoFinished.connect(self.enable_start_image_action)
@@ -536,7 +628,9 @@ class WidefieldGUI(GUIBase):
         self._mw.image_PlotWidget.addItem(self._image)
         self._mw.image_PlotWidget.setAspectLocked(True)
 
-        self._image.setLookupTable(self.my_colors.lut)
+        self._image.setLookupTable(self._display_lut)
+        # Only render as many pixels as the view can show for large sensors
+        self._image.setAutoDownsample(True)
 
         # Loading Image Fit 
         # fitted_data_image = self._widefield_logic.fit_image()
@@ -545,9 +639,20 @@ class WidefieldGUI(GUIBase):
         self._mw.image_fit_PlotWidget.addItem(self._fitted_image)
         self._mw.image_fit_PlotWidget.setAspectLocked(True)
 
-        self._fitted_image.setLookupTable(self.my_colors.lut)
+        self._fitted_image.setLookupTable(self._display_lut)
+        self._fitted_image.setAutoDownsample(True)
 
 
+        # Rescale the images once a colorbar value is entered, not for every typed digit
+        for spinbox in (self._mw.xy_cb_min_DoubleSpinBox, self._mw.xy_cb_max_DoubleSpinBox,
+                        self._mw.xy_cb_low_percentile_DoubleSpinBox,
+                        self._mw.xy_cb_high_percentile_DoubleSpinBox,
+                        self._mw.fit_xy_cb_min_DoubleSpinBox, self._mw.fit_xy_cb_max_DoubleSpinBox,
+                        self._mw.fit_xy_cb_low_percentile_DoubleSpinBox,
+                        self._mw.fit_xy_cb_high_percentile_DoubleSpinBox,
+                        self._mw.fit_range_SpinBox):
+            spinbox.setKeyboardTracking(False)
+
         # Connect the buttons and inputs for the colorbar
         self._mw.xy_cb_manual_RadioButton.clicked.connect(self.update_xy_cb_range)
         self._mw.xy_cb_centiles_RadioButton.clicked.connect(self.update_xy_cb_range)
@@ -579,39 +684,22 @@ class WidefieldGUI(GUIBase):
         self._sd.rejected.disconnect()
         self._mw.actionSettings.triggered.disconnect()
         self._mw.actionChannel_Settings.triggered.disconnect()
-        self._widefield_logic.sigParameterUpdated.disconnect()
-        self._widefield_logic.sigMeasurementChanged.disconnect()
-        self._widefield_logic.sigCameraLimits.disconnect()
-        self._widefield_logic.sigOutputStateUpdated.disconnect()
-        self._widefield_logic.sigOdmrPlotsUpdated.disconnect()
-        self._widefield_logic.sigOdmrFitUpdated.disconnect()
-        self._widefield_logic.sigOdmrElapsedTimeUpdated.disconnect()
-        # self._widefield_logic.sigMeasurementDataUpdated.disconnect()
-        # self._widefield_logic.sigTimerUpdated.disconnect()
-        self._widefield_logic.sigFitUpdated.disconnect()
-        self._widefield_logic.sigMeasurementStatusUpdated.disconnect()
-        # self._widefield_logic.sigPulserRunningUpdated.disconnect()
-        self._widefield_logic.sigExtMicrowaveRunningUpdated.disconnect()
-        self._widefield_logic.sigExtMicrowaveSettingsUpdated.disconnect()
-        self._widefield_logic.sigFastCounterSettingsUpdated.disconnect()
-        self._widefield_logic.sigMeasurementSettingsUpdated.disconnect()
-        self._widefield_logic.sigAnalysisSettingsUpdated.disconnect()
-        self._widefield_logic.sigExtractionSettingsUpdated.disconnect()
-
-        self._widefield_logic.sigBlockDictUpdated.disconnect()
-        self._widefield_logic.sigEnsembleDictUpdated.disconnect()
-        self._widefield_logic.sigSequenceDictUpdated.disconnect()
-        self._widefield_logic.sigAvailableWaveformsUpdated.disconnect()
-        self._widefield_logic.sigAvailableSequencesUpdated.disconnect()
-        self._widefield_logic.sigSampleEnsembleComplete.disconnect()
-        self._widefield_logic.sigSampleSequenceComplete.disconnect()
-        self._widefield_logic.sigLoadedAssetUpdated.disconnect()
-        self._widefield_logic.sigGeneratorSettingsUpdated.disconnect()
-        self._widefield_logic.sigSamplingSettingsUpdated.disconnect()
-        self._widefield_logic.sigPredefinedSequenceGenerated.disconnect()
-
-        # self._widefield_logic.sigExtMicrowave1SettingsUpdated.disconnect()
-        # self._widefield_logic.sigExtMicrowave2SettingsUpdated.disconnect()
+        # The logic modules outlive this GUI and may serve other modules, so only our own slots are
+        # disconnected, and only from signals that were actually connected in on_activate.
+        self._widefield_logic.sigPlotImageFit.disconnect(self.update_image_fit)
+        self._widefield_logic.sigParameterUpdated.disconnect(self.update_parameter)
+        self._widefield_logic.sigCameraLimits.disconnect(self.update_camera_limits)
+        self._widefield_logic.sigOutputStateUpdated.disconnect(self.update_status)
+        self._widefield_logic.sigOdmrPlotsUpdated.disconnect(self.update_plots)
+        self._widefield_logic.sigOdmrFitUpdated.disconnect(self.update_fit)
+        self._widefield_logic.sigOdmrElapsedTimeUpdated.disconnect(self.update_elapsedtime)
+        self._widefield_logic.sigMeasurementChanged.disconnect(self._change_measurement_type)
+        self._widefield_logic.sigSampleEnsembleComplete.disconnect(self.sample_ensemble_finished)
+
+        self._camera_logic.sigUpdateDisplay.disconnect(self.update_data)
+        self._mw.sigWindowRestored.disconnect()
+        self._camera_logic.sigAcquisitionFinished.disconnect(self.acquisition_finished)
+        self._camera_logic.sigVideoFinished.disconnect(self.enable_start_image_action)
 
         self.sigCwMwOn.disconnect()
         self.sigMwOff.disconnect()
@@ -632,6 +720,9 @@ class WidefieldGUI(GUIBase):
         self.sigGPIOSettingsChanged.disconnect()
         self.sigSaveMeasurement.disconnect()
         self.sigChangeMeasurementType.disconnect()
+        self.sigVideoStart.disconnect()
+        self.sigVideoStop.disconnect()
+        self.sigImageStart.disconnect()
         # self.sigMeasurementChanged.disconnect()
 
         self._mw.cam_connect_RadioButton.clicked.disconnect()
@@ -657,6 +748,12 @@ class WidefieldGUI(GUIBase):
         self._mw.pixel_format_comboBox.currentTextChanged.disconnect()
         self._mw.plot_pixel_x_spinBox.editingFinished.disconnect()
         self._mw.plot_pixel_y_spinBox.editingFinished.disconnect()
+        self._cam_params_timer.stop()
+        self._cam_params_timer.timeout.disconnect()
+        self._sweep_params_timer.stop()
+        self._sweep_params_timer.timeout.disconnect()
+        self._render_timer.stop()
+        self._render_timer.timeout.disconnect()
 
         self._mw.pulser_on_off_PushButton.clicked.disconnect()
         self._mw.clear_device_PushButton.clicked.disconnect()
@@ -672,10 +769,11 @@ class WidefieldGUI(GUIBase):
         self._mw.ext_control_mw2_power_DoubleSpinBox.editingFinished.disconnect()
 
 
-        dspinbox_dict = self.get_all_dspinboxes_from_groupbox()
-        for identifier_name in dspinbox_dict:
-            dspinbox_type_list = dspinbox_dict[identifier_name]
-            [dspinbox_type.editingFinished.disconnect() for dspinbox_type in dspinbox_type_list]
+        for dspinbox in self._all_range_spinboxes():
+            dspinbox.editingFinished.disconnect()
+        for range_row in self._range_row_pool:
+            for identifier in ('start', 'step', 'stop'):
+                range_row[identifier].editingFinished.disconnect()
 
         # self._mw.cw_power_DoubleSpinBox.editingFinished.disconnect()
         # self._mw.sweep_power_DoubleSpinBox.editingFinished.disconnect()
@@ -715,63 +813,28 @@ class WidefieldGUI(GUIBase):
         """
         # make sure the logic keeps track
         groupBox = self._mw.measurement_control_DockWidget.ranges_GroupBox
-        gridLayout = groupBox.layout()
-        mw1_constraints = self._widefield_logic.ext_microwave1_constraints
+        mw1_constraints = self._mw1_constraints
 
         insertion_row = self._widefield_logic.ranges
-        # start
-        start_label = QtWidgets.QLabel(groupBox)
-        start_label.setText('Start:')
-        setattr(self._mw.measurement_control_DockWidget, 'start_label_{}'.format(insertion_row), start_label)
-        start_freq_DoubleSpinBox = ScienDSpinBox(groupBox)
-        start_freq_DoubleSpinBox.setSuffix('Hz')
-        start_freq_DoubleSpinBox.setMaximum(mw1_constraints.max_frequency)
-        start_freq_DoubleSpinBox.setMinimum(mw1_constraints.min_frequency)
-        start_freq_DoubleSpinBox.setMinimumSize(QtCore.QSize(80, 0))
-        start_freq_DoubleSpinBox.setValue(self._widefield_logic.mw_starts[0])
-        start_freq_DoubleSpinBox.setMinimumWidth(75)
-        start_freq_DoubleSpinBox.setMaximumWidth(100)
-        start_freq_DoubleSpinBox.editingFinished.connect(self.change_sweep_params)
-        setattr(self._mw.measurement_control_DockWidget, 'start_freq_DoubleSpinBox_{}'.format(insertion_row),
-                start_freq_DoubleSpinBox)
-        gridLayout.addWidget(start_label, insertion_row, 1, 1, 1)
-        gridLayout.addWidget(start_freq_DoubleSpinBox, insertion_row, 2, 1, 1)
-
-        # step
-        step_label = QtWidgets.QLabel(groupBox)
-        step_label.setText('Step:')
-        setattr(self._mw.measurement_control_DockWidget, 'step_label_{}'.format(insertion_row), step_label)
-        step_freq_DoubleSpinBox = ScienDSpinBox(groupBox)
-        step_freq_DoubleSpinBox.setSuffix('Hz')
-        step_freq_DoubleSpinBox.setMaximum(100e9)
-        step_freq_DoubleSpinBox.setMinimumSize(QtCore.QSize(80, 0))
-        step_freq_DoubleSpinBox.setValue(self._widefield_logic.mw_steps[0])
-        step_freq_DoubleSpinBox.setMinimumWidth(75)
-        step_freq_DoubleSpinBox.setMaximumWidth(100)
-        step_freq_DoubleSpinBox.editingFinished.connect(self.change_sweep_params)
-        setattr(self._mw.measurement_control_DockWidget, 'step_freq_DoubleSpinBox_{}'.format(insertion_row),
-                step_freq_DoubleSpinBox)
-        gridLayout.addWidget(step_label, insertion_row, 3, 1, 1)
-        gridLayout.addWidget(step_freq_DoubleSpinBox, insertion_row, 4, 1, 1)
-
-        # stop
-        stop_label = QtWidgets.QLabel(groupBox)
-        stop_label.setText('Stop:')
-        setattr(self._mw.measurement_control_DockWidget, 'stop_label_{}'.format(insertion_row), stop_label)
-        stop_freq_DoubleSpinBox = ScienDSpinBox(groupBox)
-        stop_freq_DoubleSpinBox.setSuffix('Hz')
-        stop_freq_DoubleSpinBox.setMaximum(mw1_constraints.max_frequency)
-        stop_freq_DoubleSpinBox.setMinimum(mw1_constraints.min_frequency)
-        stop_freq_DoubleSpinBox.setMinimumSize(QtCore.QSize(80, 0))
-        stop_freq_DoubleSpinBox.setValue(self._widefield_logic.mw_stops[0])
-        stop_freq_DoubleSpinBox.setMinimumWidth(75)
-        stop_freq_DoubleSpinBox.setMaximumWidth(100)
-        stop_freq_DoubleSpinBox.editingFinished.connect(self.change_sweep_params)
-        setattr(self._mw.measurement_control_DockWidget, 'stop_freq_DoubleSpinBox_{}'.format(insertion_row),
-                stop_freq_DoubleSpinBox)
-
-        gridLayout.addWidget(stop_label, insertion_row, 5, 1, 1)
-        gridLayout.addWidget(stop_freq_DoubleSpinBox, insertion_row, 6, 1, 1)
+        start = self._widefield_logic.mw_starts[0]
+        step = self._widefield_logic.mw_steps[0]
+        stop = self._widefield_logic.mw_stops[0]
+        # repaint the groupbox once after the whole row is in place
+        groupBox.setUpdatesEnabled(False)
+        try:
+            if self._range_row_pool:
+                range_row = self._range_row_pool.pop()
+                self._place_range_row(groupBox, insertion_row, range_row)
+                for identifier, value in (('start', start), ('step', step), ('stop', stop)):
+                    range_row[identifier].setValue(value)
+                for widget in range_row.values():
+                    widget.show()
+            else:
+                range_row = self._create_range_row(groupBox, insertion_row, mw1_constraints,
+                                                   start, step, stop)
+        finally:
+            groupBox.setUpdatesEnabled(True)
+        self._range_rows.append(range_row)
 
         starts = self.get_frequencies_from_spinboxes('start')
         stops = self.get_frequencies_from_spinboxes('stop')
@@ -779,8 +842,8 @@ class WidefieldGUI(GUIBase):
         power = self._mw.ext_control_mw1_power_DoubleSpinBox.value()
 
         self.sigMwSweepParamsChanged.emit(starts, stops, steps, power)
-        self._mw.fit_range_SpinBox.setMaximum(self._widefield_logic.ranges)
         self._widefield_logic.ranges += 1
+        self._mw.fit_range_SpinBox.setMaximum(self._widefield_logic.ranges - 1)
 
         # remove stuff that remained from the old range that might have been in place there
         key = 'channel: {0}, range: {1}'.format(self.display_channel, self._widefield_logic.ranges - 1)
@@ -797,14 +860,16 @@ class WidefieldGUI(GUIBase):
         groupBox = self._mw.measurement_control_DockWidget.ranges_GroupBox
         gridLayout = groupBox.layout()
 
-        object_dict = self.get_objects_from_groupbox_row(remove_row)
+        range_row = self._range_rows.pop(remove_row)
 
-        for object_name in object_dict:
-            if 'DoubleSpinBox' in object_name:
-                object_dict[object_name].editingFinished.disconnect()
-            object_dict[object_name].hide()
-            gridLayout.removeWidget(object_dict[object_name])
-            del self._mw.measurement_control_DockWidget.__dict__[object_name]
+        groupBox.setUpdatesEnabled(False)
+        try:
+            for widget in range_row.values():
+                widget.hide()
+                gridLayout.removeWidget(widget)
+        finally:
+            groupBox.setUpdatesEnabled(True)
+        self._range_row_pool.append(range_row)
 
         starts = self.get_frequencies_from_spinboxes('start')
         stops = self.get_frequencies_from_spinboxes('stop')
@@ -818,51 +883,23 @@ class WidefieldGUI(GUIBase):
         self._mw.fit_range_SpinBox.setMaximum(max_val)
         if self._widefield_logic.range_to_fit > max_val:
             self._widefield_logic.range_to_fit = max_val
-
-        self._mw.fit_range_SpinBox.setMaximum(max_val)
-        
         return
 
     def get_objects_from_groupbox_row(self, row):
-        # get elements from the row
-        # first strings
-
-        start_label_str = 'start_label_{}'.format(row)
-        step_label_str = 'step_label_{}'.format(row)
-        stop_label_str = 'stop_label_{}'.format(row)
-
-        # get widgets
-        start_freq_DoubleSpinBox_str = 'start_freq_DoubleSpinBox_{}'.format(row)
-        step_freq_DoubleSpinBox_str = 'step_freq_DoubleSpinBox_{}'.format(row)
-        stop_freq_DoubleSpinBox_str = 'stop_freq_DoubleSpinBox_{}'.format(row)
-
-        # now get the objects
-        start_label = getattr(self._mw.measurement_control_DockWidget, start_label_str)
-        step_label = getattr(self._mw.measurement_control_DockWidget, step_label_str)
-        stop_label = getattr(self._mw.measurement_control_DockWidget, stop_label_str)
-
-        start_freq_DoubleSpinBox = getattr(self._mw.measurement_control_DockWidget, start_freq_DoubleSpinBox_str)
-        step_freq_DoubleSpinBox = getattr(self._mw.measurement_control_DockWidget, step_freq_DoubleSpinBox_str)
-        stop_freq_DoubleSpinBox = getattr(self._mw.measurement_control_DockWidget, stop_freq_DoubleSpinBox_str)
+        """ Return the labels and frequency spinboxes of a row in the ranges GroupBox.
 
-        return_dict = {start_label_str: start_label, step_label_str: step_label,
-                       stop_label_str: stop_label,
-                       start_freq_DoubleSpinBox_str: start_freq_DoubleSpinBox,
-                       step_freq_DoubleSpinBox_str: step_freq_DoubleSpinBox,
-                       stop_freq_DoubleSpinBox_str: stop_freq_DoubleSpinBox
-                       }
-
-        return return_dict
+        @param int row: index of the frequency range
+        @return dict: widgets keyed by 'start', 'step', 'stop' and '<identifier>_label'
+        """
+        return self._range_rows[row]
 
     def get_freq_dspinboxes_from_groubpox(self, identifier):
-        dspinboxes = []
-        for name in self._mw.measurement_control_DockWidget.__dict__:
-            box_name = identifier + '_freq_DoubleSpinBox'
-            if box_name in name:
-                freq_DoubleSpinBox = getattr(self._mw.measurement_control_DockWidget, name)
-                dspinboxes.append(freq_DoubleSpinBox)
+        return [range_row[identifier] for range_row in self._range_rows]
 
-        return dspinboxes
+    def _all_range_spinboxes(self):
+        """ Iterate over the start, step and stop spinboxes of all range rows """
+        return (range_row[identifier] for range_row in self._range_rows
+                for identifier in ('start', 'step', 'stop'))
 
     def get_all_dspinboxes_from_groupbox(self):
         identifiers = ['start', 'step', 'stop']
@@ -880,7 +917,10 @@ class WidefieldGUI(GUIBase):
 
     def run_stop_odmr(self, is_checked):
         """ Manages what happens if odmr scan is started/stopped. """
+        mcd = self._mw.measurement_control_DockWidget
         if is_checked:
+            # the measurement has to start with the settings edited just before
+            self.flush_pending_params()
             # change the axes appearance according to input values:
             self._mw.action_run_stop.setEnabled(False)
             self._mw.action_resume_odmr.setEnabled(False)
@@ -889,38 +929,12 @@ class WidefieldGUI(GUIBase):
             # self._mw.cw_power_DoubleSpinBox.setEnabled(False)
             # self._mw.sweep_power_DoubleSpinBox.setEnabled(False)
             # self._mw.cw_frequency_DoubleSpinBox.setEnabled(False)
-            self._mw.gainSpinBox.setEnabled(False)
-            self._mw.triggerMode_checkBox.setEnabled(False)
-            self._mw.exposuremode_comboBox.setEnabled(False)
-            self._mw.exposureDSpinBox.setEnabled(False)
-            self._mw.x_pixels_SpinBox.setEnabled(False)
-            self._mw.y_pixels_SpinBox.setEnabled(False)
-            self._mw.offset_x_spinBox.setEnabled(False)
-            self._mw.offset_y_spinBox.setEnabled(False)
-            self._mw.pixel_format_comboBox.setEnabled(False)
-            self._mw.plot_pixel_x_spinBox.setEnabled(False)
-            self._mw.plot_pixel_y_spinBox.setEnabled(False)
-
-            self._mw.pulser_on_off_PushButton.setEnabled(False)
-            self._mw.clear_device_PushButton.setEnabled(False)
-            self._mw.plot_seq_PushButton.setEnabled(False)    
-            self._mw.ext_control_use_mw1_CheckBox.setEnabled(False)
-            self._mw.ext_control_mw1_freq_DoubleSpinBox.setEnabled(False)
-            self._mw.ext_control_mw1_power_DoubleSpinBox.setEnabled(False)
-            self._mw.ext_control_use_mw2_CheckBox.setEnabled(False)
-            self._mw.ext_control_mw2_freq_DoubleSpinBox.setEnabled(False)
-            self._mw.ext_control_mw2_power_DoubleSpinBox.setEnabled(False)
-
-            
-            dspinbox_dict = self.get_all_dspinboxes_from_groupbox()
-            for identifier_name in dspinbox_dict:
-                dspinbox_type_list = dspinbox_dict[identifier_name]
-                [dspinbox_type.setEnabled(False) for dspinbox_type in dspinbox_type_list]
-            self._mw.measurement_control_DockWidget.add_range_button.setEnabled(False)
-            self._mw.measurement_control_DockWidget.remove_range_button.setEnabled(False)
-            self._mw.runtime_DoubleSpinBox.setEnabled(False)
-            self._mw.autosave_num_spinBox.setEnabled(False)
-            self._sd.frame_rate_DoubleSpinBox.setEnabled(False)
+            self._set_enabled(self._camera_setting_widgets, False)
+            self._set_enabled(self._device_widgets, False)
+            self._set_enabled(self._all_range_spinboxes(), False)
+            mcd.add_range_button.setEnabled(False)
+            mcd.remove_range_button.setEnabled(False)
+            self._set_enabled(self._scan_setting_widgets, False)
             self.sigStartOdmrScan.emit()
         else:
             self._mw.action_run_stop.setEnabled(False)
@@ -930,34 +944,20 @@ class WidefieldGUI(GUIBase):
         return
 
     def resume_odmr(self, is_checked):
+        mcd = self._mw.measurement_control_DockWidget
         if is_checked:
+            self.flush_pending_params()
             self._mw.action_run_stop.setEnabled(False)
             self._mw.action_resume_odmr.setEnabled(False)
             self._mw.action_toggle_cw.setEnabled(False)
             # self._mw.cw_power_DoubleSpinBox.setEnabled(False)
             # self._mw.sweep_power_DoubleSpinBox.setEnabled(False)
             # self._mw.cw_frequency_DoubleSpinBox.setEnabled(False)
-            self._mw.gainSpinBox.setEnabled(False)
-            self._mw.triggerMode_checkBox.stateChanged.setEnabled(False)
-            self._mw.exposuremode_comboBox.currentTextChanged.setEnabled(False)
-            self._mw.exposureDSpinBox.setEnabled(False)
-            self._mw.x_pixels_SpinBox.setEnabled(False)
-            self._mw.y_pixels_SpinBox.setEnabled(False)
-            self._mw.offset_x_spinBox.setEnabled(False)
-            self._mw.offset_y_spinBox.setEnabled(False)
-            self._mw.pixel_format_comboBox.currentTextChanged.setEnabled(False)
-            self._mw.plot_pixel_x_spinBox.setEnabled(False)
-            self._mw.plot_pixel_y_spinBox.setEnabled(False)
-
-            dspinbox_dict = self.get_all_dspinboxes_from_groupbox()
-            for identifier_name in dspinbox_dict:
-                dspinbox_type_list = dspinbox_dict[identifier_name]
-                [dspinbox_type.setEnabled(False) for dspinbox_type in dspinbox_type_list]
-            self._mw.measurement_control_DockWidget.add_range_button.setEnabled(False)
-            self._mw.measurement_control_DockWidget.remove_range_button.setEnabled(False)
-            self._mw.runtime_DoubleSpinBox.setEnabled(False)
-            self._mw.autosave_num_spinBox.setEnabled(False)
-            self._sd.frame_rate_DoubleSpinBox.setEnabled(False)
+            self._set_enabled(self._camera_setting_widgets, False)
+            self._set_enabled(self._all_range_spinboxes(), False)
+            mcd.add_range_button.setEnabled(False)
+            mcd.remove_range_button.setEnabled(False)
+            self._set_enabled(self._scan_setting_widgets, False)
             self.sigContinueOdmrScan.emit()
         else:
             self._mw.action_run_stop.setEnabled(False)
@@ -966,6 +966,12 @@ class WidefieldGUI(GUIBase):
             self.sigStopOdmrScan.emit()
         return
 
+    @staticmethod
+    def _set_enabled(widgets, enabled):
+        """ Enable or disable all widgets of a group """
+        for widget in widgets:
+            widget.setEnabled(enabled)
+
     def toggle_cw_mode(self, is_checked):
         """ Starts or stops CW microwave output if no measurement is running. """
         if is_checked:
@@ -987,6 +993,7 @@ class WidefieldGUI(GUIBase):
         @param str mw_mode: is the microwave output active?
         @param bool is_running: is the microwave output active?
         """
+        mcd = self._mw.measurement_control_DockWidget
         # Block signals from firing
         self._mw.action_run_stop.blockSignals(True)
         self._mw.action_resume_odmr.blockSignals(True)
@@ -997,42 +1004,17 @@ class WidefieldGUI(GUIBase):
             self._mw.action_resume_odmr.setEnabled(False)
             # self._mw.cw_power_DoubleSpinBox.setEnabled(False)
             # self._mw.cw_frequency_DoubleSpinBox.setEnabled(False)
-            self._mw.gainSpinBox.setEnabled(False)
-            self._mw.triggerMode_checkBox.setEnabled(False)
-            self._mw.exposuremode_comboBox.setEnabled(False)
-            self._mw.exposureDSpinBox.setEnabled(False)
-            self._mw.x_pixels_SpinBox.setEnabled(False)
-            self._mw.y_pixels_SpinBox.setEnabled(False)
-            self._mw.offset_x_spinBox.setEnabled(False)
-            self._mw.offset_y_spinBox.setEnabled(False)
-            self._mw.pixel_format_comboBox.setEnabled(False)
-            self._mw.plot_pixel_x_spinBox.setEnabled(False)
-            self._mw.plot_pixel_y_spinBox.setEnabled(False)
-
-            self._mw.pulser_on_off_PushButton.setEnabled(False)
-            self._mw.clear_device_PushButton.setEnabled(False)
-            self._mw.plot_seq_PushButton.setEnabled(False)    
-            self._mw.ext_control_use_mw1_CheckBox.setEnabled(False)
-            self._mw.ext_control_mw1_freq_DoubleSpinBox.setEnabled(False)
-            self._mw.ext_control_mw1_power_DoubleSpinBox.setEnabled(False)
-            self._mw.ext_control_use_mw2_CheckBox.setEnabled(False)
-            self._mw.ext_control_mw2_freq_DoubleSpinBox.setEnabled(False)
-            self._mw.ext_control_mw2_power_DoubleSpinBox.setEnabled(False)
-
+            self._set_enabled(self._camera_setting_widgets, False)
+            self._set_enabled(self._device_widgets, False)
             if mw_mode != 'cw':
                 self._mw.clear_odmr_PushButton.setEnabled(True)
                 self._mw.action_run_stop.setEnabled(True)
                 self._mw.action_toggle_cw.setEnabled(False)
-                dspinbox_dict = self.get_all_dspinboxes_from_groupbox()
-                for identifier_name in dspinbox_dict:
-                    dspinbox_type_list = dspinbox_dict[identifier_name]
-                    [dspinbox_type.setEnabled(False) for dspinbox_type in dspinbox_type_list]
-                self._mw.measurement_control_DockWidget.add_range_button.setEnabled(False)
-                self._mw.measurement_control_DockWidget.remove_range_button.setEnabled(False)
+                self._set_enabled(self._all_range_spinboxes(), False)
+                mcd.add_range_button.setEnabled(False)
+                mcd.remove_range_button.setEnabled(False)
                 # self._mw.sweep_power_DoubleSpinBox.setEnabled(False)
-                self._mw.runtime_DoubleSpinBox.setEnabled(False)
-                self._mw.autosave_num_spinBox.setEnabled(False)
-                self._sd.frame_rate_DoubleSpinBox.setEnabled(False)
+                self._set_enabled(self._scan_setting_widgets, False)
                 self._mw.action_run_stop.setChecked(True)
                 self._mw.action_resume_odmr.setChecked(True)
                 self._mw.action_toggle_cw.setChecked(False)
@@ -1040,16 +1022,11 @@ class WidefieldGUI(GUIBase):
                 self._mw.clear_odmr_PushButton.setEnabled(False)
                 self._mw.action_run_stop.setEnabled(False)
                 self._mw.action_toggle_cw.setEnabled(True)
-                dspinbox_dict = self.get_all_dspinboxes_from_groupbox()
-                for identifier_name in dspinbox_dict:
-                    dspinbox_type_list = dspinbox_dict[identifier_name]
-                    [dspinbox_type.setEnabled(True) for dspinbox_type in dspinbox_type_list]
-                self._mw.measurement_control_DockWidget.add_range_button.setEnabled(True)
-                self._mw.measurement_control_DockWidget.remove_range_button.setEnabled(True)
+                self._set_enabled(self._all_range_spinboxes(), True)
+                mcd.add_range_button.setEnabled(True)
+                mcd.remove_range_button.setEnabled(True)
                 # self._mw.sweep_power_DoubleSpinBox.setEnabled(True)
-                self._mw.runtime_DoubleSpinBox.setEnabled(True)
-                self._mw.autosave_num_spinBox.setEnabled(True)
-                self._sd.frame_rate_DoubleSpinBox.setEnabled(True)
+                self._set_enabled(self._scan_setting_widgets, True)
                 self._mw.action_run_stop.setChecked(False)
                 self._mw.action_resume_odmr.setChecked(False)
                 self._mw.action_toggle_cw.setChecked(True)
@@ -1058,45 +1035,21 @@ class WidefieldGUI(GUIBase):
             # self._mw.cw_power_DoubleSpinBox.setEnabled(True)
             # self._mw.sweep_power_DoubleSpinBox.setEnabled(True)
             # self._mw.cw_frequency_DoubleSpinBox.setEnabled(True)
-            self._mw.gainSpinBox.setEnabled(True)
-            self._mw.triggerMode_checkBox.setEnabled(True)
-            self._mw.exposuremode_comboBox.setEnabled(True)
-            self._mw.exposureDSpinBox.setEnabled(True)
-            self._mw.x_pixels_SpinBox.setEnabled(True)
-            self._mw.y_pixels_SpinBox.setEnabled(True)
-            self._mw.offset_x_spinBox.setEnabled(True)
-            self._mw.offset_y_spinBox.setEnabled(True)
-            self._mw.pixel_format_comboBox.setEnabled(True)
-            self._mw.plot_pixel_x_spinBox.setEnabled(True)
-            self._mw.plot_pixel_y_spinBox.setEnabled(True)
+            self._set_enabled(self._camera_setting_widgets, True)
             self._mw.clear_odmr_PushButton.setEnabled(False)
             self._mw.action_run_stop.setEnabled(True)
             self._mw.action_toggle_cw.setEnabled(True)
-            dspinbox_dict = self.get_all_dspinboxes_from_groupbox()
-            for identifier_name in dspinbox_dict:
-                dspinbox_type_list = dspinbox_dict[identifier_name]
-                [dspinbox_type.setEnabled(True) for dspinbox_type in dspinbox_type_list]
+            self._set_enabled(self._all_range_spinboxes(), True)
             if self._widefield_logic.mw_scanmode.name == 'SWEEP':
-                self._mw.measurement_control_DockWidget.add_range_button.setDisabled(True)
+                mcd.add_range_button.setDisabled(True)
             elif self._widefield_logic.mw_scanmode.name == 'LIST':
-                self._mw.measurement_control_DockWidget.add_range_button.setEnabled(True)
-            self._mw.measurement_control_DockWidget.remove_range_button.setEnabled(True)
-            self._mw.runtime_DoubleSpinBox.setEnabled(True)
-            self._mw.autosave_num_spinBox.setEnabled(True)
-            self._sd.frame_rate_DoubleSpinBox.setEnabled(True)
+                mcd.add_range_button.setEnabled(True)
+            mcd.remove_range_button.setEnabled(True)
+            self._set_enabled(self._scan_setting_widgets, True)
             self._mw.action_run_stop.setChecked(False)
             self._mw.action_resume_odmr.setChecked(False)
             self._mw.action_toggle_cw.setChecked(False)
-
-            self._mw.pulser_on_off_PushButton.setEnabled(True)
-            self._mw.clear_device_PushButton.setEnabled(True)
-            self._mw.plot_seq_PushButton.setEnabled(True)    
-            self._mw.ext_control_use_mw1_CheckBox.setEnabled(True)
-            self._mw.ext_control_mw1_freq_DoubleSpinBox.setEnabled(True)
-            self._mw.ext_control_mw1_power_DoubleSpinBox.setEnabled(True)
-            self._mw.ext_control_use_mw2_CheckBox.setEnabled(True)
-            self._mw.ext_control_mw2_freq_DoubleSpinBox.setEnabled(True)
-            self._mw.ext_control_mw2_power_DoubleSpinBox.setEnabled(True)
+            self._set_enabled(self._device_widgets, True)
 
         # Unblock signal firing
         self._mw.action_run_stop.blockSignals(False)
@@ -1221,21 +1174,29 @@ class WidefieldGUI(GUIBase):
 
     def update_plots(self, odmr_data_x, odmr_data_y, odmr_data_y1 = None, odmr_data_y2 = None,  x_label=None, unit_label=None):
         """ Refresh the plot widgets with new data. Also set x_label and unit """
+        if self._display_hidden():
+            # only the latest data is drawn once the window is shown again, keep the last axis label
+            if x_label is None and self._pending_plots is not None:
+                x_label, unit_label = self._pending_plots[4:]
+            self._pending_plots = (odmr_data_x, odmr_data_y, odmr_data_y1, odmr_data_y2, x_label, unit_label)
+            return
+        self._pending_plots = None
 
         # Update mean signal plot
         # self.odmr_image.setData(odmr_data_x, odmr_data_y,[self.display_channel])
 
-        if odmr_data_y2.size != 0:
+        if odmr_data_y2 is not None and odmr_data_y2.size != 0:
             self.odmr_image[2].setData(x=odmr_data_x,y = odmr_data_y2)
             self.odmr_image[1].setData(x=odmr_data_x,y = odmr_data_y1)
             self.odmr_image[0].setData(x=odmr_data_x,y = odmr_data_y)
+            self._extra_curves_shown = True
         else:
-            try:
-                self.odmr_image[0].setData(x=odmr_data_x, y=odmr_data_y) # Blue curve, -1
+            self.odmr_image[0].setData(x=odmr_data_x, y=odmr_data_y) # Blue curve, -1
+            # clearing the unused curves on every frame would still redraw the plot
+            if self._extra_curves_shown:
                 self.odmr_image[1].setData() # Red curve, 0
                 self.odmr_image[2].setData() # Green, +1
-            except:
-                pass
+                self._extra_curves_shown = False
         # self.update_colorbar(cb_range)
 
         if x_label:
@@ -1266,8 +1227,14 @@ class WidefieldGUI(GUIBase):
 
     def update_elapsedtime(self, elapsed_time, scanned_lines):
         """ Updates current elapsed measurement time and completed frequency sweeps """
-        self._mw.elapsed_time_lcd.display(int(np.rint(elapsed_time)))
-        self._mw.elapsed_sweeps_lcd.display(scanned_lines)
+        # The LCDs only show whole numbers, so most ticks would repaint the same value.
+        elapsed_time = int(round(elapsed_time))
+        if elapsed_time != self._displayed_elapsed_time:
+            self._displayed_elapsed_time = elapsed_time
+            self._mw.elapsed_time_lcd.display(elapsed_time)
+        if scanned_lines != self._displayed_elapsed_sweeps:
+            self._displayed_elapsed_sweeps = scanned_lines
+            self._mw.elapsed_sweeps_lcd.display(scanned_lines)
         return
 
     def update_settings(self):
@@ -1354,126 +1321,53 @@ class WidefieldGUI(GUIBase):
         The update will block the GUI signals from emitting a change back to the
         logic.
         """
-        # param = param_dict.get('sweep_mw_power')
-        # if param is not None:
-        #     self._mw.sweep_power_DoubleSpinBox.blockSignals(True)
-        #     self._mw.sweep_power_DoubleSpinBox.setValue(param)
-        #     self._mw.sweep_power_DoubleSpinBox.blockSignals(False)
-
-        mw_starts = param_dict.get('mw_starts')
-        mw_steps = param_dict.get('mw_steps')
-        mw_stops = param_dict.get('mw_stops')
-
-        if mw_starts is not None:
-            start_frequency_boxes = self.get_freq_dspinboxes_from_groubpox('start')
-            for mw_start, start_frequency_box in zip(mw_starts, start_frequency_boxes):
-                start_frequency_box.blockSignals(True)
-                start_frequency_box.setValue(mw_start)
-                start_frequency_box.blockSignals(False)
-
-        if mw_steps is not None:
-            step_frequency_boxes = self.get_freq_dspinboxes_from_groubpox('step')
-            for mw_step, step_frequency_box in zip(mw_steps, step_frequency_boxes):
-                step_frequency_box.blockSignals(True)
-                step_frequency_box.setValue(mw_step)
-                step_frequency_box.blockSignals(False)
-
-        if mw_stops is not None:
-            stop_frequency_boxes = self.get_freq_dspinboxes_from_groubpox('stop')
-            for mw_stop, stop_frequency_box in zip(mw_stops, stop_frequency_boxes):
-                stop_frequency_box.blockSignals(True)
-                stop_frequency_box.setValue(mw_stop)
-                stop_frequency_box.blockSignals(False)
-
-        param = param_dict.get('run_time')
-        if param is not None:
-            self._mw.runtime_DoubleSpinBox.blockSignals(True)
-            self._mw.runtime_DoubleSpinBox.setValue(param)
-            self._mw.runtime_DoubleSpinBox.blockSignals(False)
-
-        param = param_dict.get('autosave_num')
-        if param is not None:
-            self._mw.autosave_num_spinBox.blockSignals(True)      
-            self._mw.autosave_num_spinBox.setValue(param)
-            self._mw.autosave_num_spinBox.blockSignals(False)
-            
-        param = param_dict.get('frame_rate')
-        if param is not None:
-            self._sd.frame_rate_DoubleSpinBox.blockSignals(True)
-            self._sd.frame_rate_DoubleSpinBox.setValue(param)
-            self._sd.frame_rate_DoubleSpinBox.blockSignals(False)
-
-        # param = param_dict.get('cw_mw_frequency')
-        # if param is not None:
-        #     self._mw.cw_frequency_DoubleSpinBox.blockSignals(True)
-        #     self._mw.cw_frequency_DoubleSpinBox.setValue(param)
-        #     self._mw.cw_frequency_DoubleSpinBox.blockSignals(False)
-
-        # param = param_dict.get('cw_mw_power')
-        # if param is not None:
-        #     self._mw.cw_power_DoubleSpinBox.blockSignals(True)
-        #     self._mw.cw_power_DoubleSpinBox.setValue(param)
-        #     self._mw.cw_power_DoubleSpinBox.blockSignals(False)
-
-        param = param_dict.get('gain')
-        if param is not None:
-            self._mw.gainSpinBox.blockSignals(True)
-            self._mw.gainSpinBox.setValue(param)
-            self._mw.gainSpinBox.blockSignals(False)
-
-        param = param_dict.get('trigger_mode')
-        if param is not None:
-            self._mw.triggerMode_checkBox.blockSignals(True)
-            self._mw.triggerMode_checkBox.setChecked(param)
-            self._mw.triggerMode_checkBox.blockSignals(False)
-
-        param = param_dict.get('exposure_mode')
-        if param is not None:
-            self._mw.exposuremode_comboBox.blockSignals(True)
-            self._mw.exposuremode_comboBox.setCurrentText(param)
-            self._mw.exposuremode_comboBox.blockSignals(False)
-        
-        param = param_dict.get('exposure_time')
-        if param is not None:
-            self._mw.exposureDSpinBox.blockSignals(True)
-            self._mw.exposureDSpinBox.setValue(param)
-            self._mw.exposureDSpinBox.blockSignals(False)
-        
-        param = param_dict.get('image_size')
-        if param is not None:
-            self._mw.x_pixels_SpinBox.blockSignals(True)
-            self._mw.x_pixels_SpinBox.setValue(param[0])
-            self._mw.x_pixels_SpinBox.blockSignals(False)
-
-            self._mw.y_pixels_SpinBox.blockSignals(True)
-            self._mw.y_pixels_SpinBox.setValue(param[1])
-            self._mw.y_pixels_SpinBox.blockSignals(False)
-        
-        param = param_dict.get('image_offset')
-        if param is not None:
-            self._mw.offset_x_spinBox.blockSignals(True)
-            self._mw.offset_x_spinBox.setValue(param[0])
-            self._mw.offset_x_spinBox.blockSignals(False)
-
-            self._mw.offset_y_spinBox.blockSignals(True)
-            self._mw.offset_y_spinBox.setValue(param[1])
-            self._mw.offset_y_spinBox.blockSignals(False)
-        
-        param = param_dict.get('pixel_format')
-        if param is not None:
-            self._mw.pixel_format_comboBox.blockSignals(True)
-            self._mw.pixel_format_comboBox.setCurrentText(param)
-            self._mw.pixel_format_comboBox.blockSignals(False)
-        
-        param = param_dict.get('plot_pixel')
-        if param is not None:
-            self._mw.plot_pixel_x_spinBox.blockSignals(True)
-            self._mw.plot_pixel_x_spinBox.setValue(param[0])
-            self._mw.plot_pixel_x_spinBox.blockSignals(False)
-
-            self._mw.plot_pixel_y_spinBox.blockSignals(True)
-            self._mw.plot_pixel_y_spinBox.setValue(param[1])
-            self._mw.plot_pixel_y_spinBox.blockSignals(False)
+        for name, param in param_dict.items():
+            if param is None:
+                continue
+            identifier = self._range_params.get(name)
+            if identifier is not None:
+                for value, dspinbox in zip(param, self.get_freq_dspinboxes_from_groubpox(identifier)):
+                    self._set_silently(dspinbox.setValue, value)
+                continue
+            setters = self._param_setters.get(name)
+            if setters is None:
+                continue
+            if len(setters) == 1:
+                self._set_silently(setters[0], param)
+            else:
+                # parameters like image_size are (x, y) tuples spread over two widgets
+                for setter, value in zip(setters, param):
+                    self._set_silently(setter, value)
+        return
+
+    @staticmethod
+    def _set_silently(setter, value):
+        """ Call the setter of a widget without letting the widget emit signals.
+
+        @param setter: bound setter method of the widget, e.g. spinbox.setValue
+        @param value: value to pass to the setter
+        """
+        widget = setter.__self__
+        was_blocked = widget.blockSignals(True)
+        try:
+            setter(value)
+        finally:
+            widget.blockSignals(was_blocked)
+        return
+
+    @staticmethod
+    def _update_combo_items(combo, items, current_text):
+        """ Fill a combo box with the given items and select current_text without emitting signals.
+
+        The items are only replaced if they differ from the ones already in the combo box.
+        """
+        items = [str(item) for item in items]
+        combo.blockSignals(True)
+        if items != [combo.itemText(index) for index in range(combo.count())]:
+            combo.clear()
+            combo.addItems(items)
+        combo.setCurrentText(current_text)
+        combo.blockSignals(False)
         return
 
     def update_camera_limits(self, constraints):
@@ -1508,58 +1402,26 @@ class WidefieldGUI(GUIBase):
         self._mw.plot_pixel_y_spinBox.setMinimum(limits["plot_pixel_y"][0])
         self._mw.plot_pixel_y_spinBox.setMaximum(limits["plot_pixel_y"][1])
 
-        self._mw.exposuremode_comboBox.blockSignals(True)
-        self._mw.exposuremode_comboBox.clear()
-        for mode in limits["exposure_modes"]:
-            self._mw.exposuremode_comboBox.addItem(mode)
-        self._mw.exposuremode_comboBox.setCurrentText(self._widefield_logic.exposure_mode)
-        self._mw.exposuremode_comboBox.blockSignals(False)
+        self._update_combo_items(self._mw.exposuremode_comboBox, limits["exposure_modes"],
+                                 self._widefield_logic.exposure_mode)
+        self._update_combo_items(self._mw.pixel_format_comboBox, limits["pixel_formats"],
+                                 self._widefield_logic.pixel_format)
 
-        self._mw.pixel_format_comboBox.blockSignals(True)
-        self._mw.pixel_format_comboBox.clear()
-        for mode in limits["pixel_formats"]:
-            self._mw.pixel_format_comboBox.addItem(mode)
-        self._mw.pixel_format_comboBox.setCurrentText(self._widefield_logic.pixel_format)
-        self._mw.pixel_format_comboBox.blockSignals(False)
-
-        self._cs.inputline_comboBox.blockSignals(True)
-        self._cs.inputline_comboBox.clear()
-        for mode in input_limits["LineSelector"]:
-            self._cs.inputline_comboBox.addItem(str(mode))
-        self._cs.inputline_comboBox.setCurrentText(str(self._widefield_logic.input_line))
-        self._cs.inputline_comboBox.blockSignals(False)
-
-        self._cs.inputtriggerselector_comboBox.blockSignals(True)
-        self._cs.inputtriggerselector_comboBox.clear()
-        for mode in input_limits["TriggerSelectors"]:
-            self._cs.inputtriggerselector_comboBox.addItem(mode)
-        self._cs.inputtriggerselector_comboBox.setCurrentText(self._widefield_logic.input_line_trigger_selector)
-        self._cs.inputtriggerselector_comboBox.blockSignals(False)
-
-        self._cs.inputtriggeractivation_comboBox.blockSignals(True)
-        self._cs.inputtriggeractivation_comboBox.clear()
-        for mode in input_limits["TriggerActivations"]:
-            self._cs.inputtriggeractivation_comboBox.addItem(mode)
-        self._cs.inputtriggeractivation_comboBox.setCurrentText(self._widefield_logic.input_line_activation)
-        self._cs.inputtriggeractivation_comboBox.blockSignals(False)
+        self._update_combo_items(self._cs.inputline_comboBox, input_limits["LineSelector"],
+                                 str(self._widefield_logic.input_line))
+        self._update_combo_items(self._cs.inputtriggerselector_comboBox, input_limits["TriggerSelectors"],
+                                 self._widefield_logic.input_line_trigger_selector)
+        self._update_combo_items(self._cs.inputtriggeractivation_comboBox, input_limits["TriggerActivations"],
+                                 self._widefield_logic.input_line_activation)
 
 
         self._cs.inputTriggerDelay_DoubleSpinBox.setMinimum(input_limits["TriggerDelays"][0])
         self._cs.inputTriggerDelay_DoubleSpinBox.setMaximum(input_limits["TriggerDelays"][1])
 
-        self._cs.outputline_comboBox.blockSignals(True)
-        self._cs.outputline_comboBox.clear()
-        for mode in output_limits["LineSelector"]:
-            self._cs.outputline_comboBox.addItem(str(mode))
-        self._cs.outputline_comboBox.setCurrentText(str(self._widefield_logic.output_line))
-        self._cs.outputline_comboBox.blockSignals(False)
-
-        self._cs.outputlinesource_comboBox.blockSignals(True)
-        self._cs.outputlinesource_comboBox.clear()
-        for mode in output_limits["LineSource"]:
-            self._cs.outputlinesource_comboBox.addItem(mode)
-        self._cs.outputlinesource_comboBox.setCurrentText(self._widefield_logic.output_line_source)
-        self._cs.outputlinesource_comboBox.blockSignals(False)
+        self._update_combo_items(self._cs.outputline_comboBox, output_limits["LineSelector"],
+                                 str(self._widefield_logic.output_line))
+        self._update_combo_items(self._cs.outputlinesource_comboBox, output_limits["LineSource"],
+                                 self._widefield_logic.output_line_source)
 
         self._cs.outputpulsemin_DoubleSpinBox.setMinimum(output_limits["MinimumOutputPulse"][0])
         self._cs.outputpulsemin_DoubleSpinBox.setMaximum(output_limits["MinimumOutputPulse"][1])
@@ -1584,6 +1446,10 @@ class WidefieldGUI(GUIBase):
         """ Update the camera settings from pylon """
         self.sigUpdateFromCam.emit()
 
+    def schedule_camera_params(self, *args):
+        """ (Re)start the delay after which the camera settings are sent to the logic """
+        self._cam_params_timer.start()
+
     def change_camera_params(self):
         """ Change camera properties """
 
@@ -1599,6 +1465,19 @@ class WidefieldGUI(GUIBase):
 
         self.sigCamParamsChanged.emit(cam_params)
 
+    def schedule_sweep_params(self):
+        """ (Re)start the delay after which the sweep parameters are sent to the logic """
+        self._sweep_params_timer.start()
+
+    def flush_pending_params(self):
+        """ Send camera and sweep settings still waiting for their delay to run out right away """
+        if self._cam_params_timer.isActive():
+            self._cam_params_timer.stop()
+            self.change_camera_params()
+        if self._sweep_params_timer.isActive():
+            self._sweep_params_timer.stop()
+            self.change_sweep_params()
+
     def change_sweep_params(self):
         """ Change start, stop and step frequency of frequency sweep """
         starts = []
@@ -1626,17 +1505,8 @@ class WidefieldGUI(GUIBase):
         return
 
     def get_frequencies_from_row(self, row):
-        object_dict = self.get_objects_from_groupbox_row(row)
-        for object_name in object_dict:
-            if "DoubleSpinBox" in object_name:
-                if "start" in object_name:
-                    start = object_dict[object_name].value()
-                elif "step" in object_name:
-                    step = object_dict[object_name].value()
-                elif "stop" in object_name:
-                    stop = object_dict[object_name].value()
-
-        return start, stop, step
+        range_row = self._range_rows[row]
+        return range_row['start'].value(), range_row['stop'].value(), range_row['step'].value()
 
     def change_runtime(self):
         """ Change time after which microwave sweep is stopped """
@@ -1721,14 +1591,33 @@ class WidefieldGUI(GUIBase):
         self._mw.start_image_Action.setEnabled(True)
 
     def update_data(self):
+        """
+        Schedule drawing the latest image of the logic on the window
+        """
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _render_frame(self):
         """
         Get the image data from the logic and print it on the window
         """
-        raw_data_image = self._camera_logic.get_last_image()
-        levels = (0., 1.)
-        self._image.setImage(image=raw_data_image)
-        self.update_xy_cb_range()
-        # self._image.setImage(image=raw_data_image, levels=levels)
+        # Nobody can see the image, draw the latest frame once the window is shown again
+        if self._display_hidden():
+            self._image_pending = True
+            return
+        self._image_pending = False
+        self.refresh_xy_image()
+
+    def _display_hidden(self):
+        """ Whether the image and the ODMR plot can currently not be seen """
+        return self._mw.isMinimized() or not self._mw.image_PlotWidget.isVisible()
+
+    def _flush_pending_display(self):
+        """ Draw the frame and plot data that arrived while the window was hidden """
+        if self._image_pending:
+            self._render_frame()
+        if self._pending_plots is not None:
+            self.update_plots(*self._pending_plots)
 
     def updateView(self):
         """
@@ -1737,11 +1626,15 @@ class WidefieldGUI(GUIBase):
         pass
 
 # color bar functions
-    def get_xy_cb_range(self):
+    def get_xy_cb_range(self, image=None):
         """ Determines the cb_min and cb_max values for the xy scan image
+
+        @param numpy.ndarray image: optional, image to scale. Defaults to the displayed image.
         """
+        if image is None:
+            image = self._image.image
         # If "Manual" is checked, or the image data is empty (all zeros), then take manual cb range.
-        if self._mw.xy_cb_manual_RadioButton.isChecked() or np.max(self._image.image) == 0.0:
+        if self._mw.xy_cb_manual_RadioButton.isChecked() or np.max(image) == 0.0:
             cb_min = self._mw.xy_cb_min_DoubleSpinBox.value()
             cb_max = self._mw.xy_cb_max_DoubleSpinBox.value()
 
@@ -1753,22 +1646,43 @@ class WidefieldGUI(GUIBase):
             low_centile = self._mw.xy_cb_low_percentile_DoubleSpinBox.value()
             high_centile = self._mw.xy_cb_high_percentile_DoubleSpinBox.value()
 
-            cb_min = np.percentile(self._image.image, low_centile)
-            cb_max = np.percentile(self._image.image, high_centile)
+            cb_min, cb_max = self._fast_percentiles(image, low_centile, high_centile)
 
         cb_range = [cb_min, cb_max]
 
         return cb_range
 
-    def refresh_xy_colorbar(self):
+    def _fast_percentiles(self, image, low_centile, high_centile):
+        """ Estimate two percentiles of an image from an evenly strided subsample.
+
+        @param numpy.ndarray image: 2D image data
+        @param float low_centile: lower percentile in the range [0, 100]
+        @param float high_centile: upper percentile in the range [0, 100]
+
+        @return tuple(float, float): the estimated low and high percentile values
+        """
+        # Keep roughly _centile_samples pixels so the cost no longer scales with the sensor size.
+        stride = max(1, int(np.sqrt(image.size / self._centile_samples)))
+        sample = image[::stride, ::stride]
+        # A single call with both centiles shares one partition of the sample.
+        low, high = np.percentile(sample, (low_centile, high_centile))
+        return low, high
+
+    def refresh_xy_colorbar(self, cb_range=None):
         """ Adjust the xy colorbar.
 
         Calls the refresh method from colorbar, which takes either the lowest
         and higherst value in the image or predefined ranges. Note that you can
         invert the colorbar if the lower border is bigger then the higher one.
+
+        @param list cb_range: optional, already computed colorbar range
         """
-        cb_range = self.get_xy_cb_range()
-        self.xy_cb.refresh_colorbar(cb_range[0], cb_range[1])
+        if cb_range is None:
+            cb_range = self.get_xy_cb_range()
+        # The colorbar picture only depends on its range, skip redrawing it for an unchanged one
+        if cb_range != self._xy_cb_range:
+            self._xy_cb_range = cb_range
+            self.xy_cb.refresh_colorbar(cb_range[0], cb_range[1])
 
     def refresh_xy_image(self):
         """ Update the current XY image from the logic.
@@ -1778,13 +1692,13 @@ class WidefieldGUI(GUIBase):
         """
         self._image.getViewBox().updateAutoRange()
 
-        xy_image_data = self._camera_logic._last_image
+        xy_image_data = self._camera_logic.get_last_image()
 
-        cb_range = self.get_xy_cb_range()
+        cb_range = self.get_xy_cb_range(xy_image_data)
 
         # Now update image with new color scale, and update colorbar
         self._image.setImage(image=xy_image_data, levels=(cb_range[0], cb_range[1]))
-        self.refresh_xy_colorbar()
+        self.refresh_xy_colorbar(cb_range)
 
     def shortcut_to_xy_cb_manual(self):
         """Someone edited the absolute counts range for the xy colour bar, better update."""
@@ -1798,7 +1712,7 @@ class WidefieldGUI(GUIBase):
 
     def update_xy_cb_range(self):
         """Redraw xy colour bar and scan image."""
-        self.refresh_xy_colorbar()
+        # refresh_xy_image redraws the colorbar with the range it computed
         self.refresh_xy_image()
 
 # Image Fit functions
@@ -1831,7 +1745,9 @@ class WidefieldGUI(GUIBase):
         invert the colorbar if the lower border is bigger then the higher one.
         """
         fit_cb_range = self.get_fitted_xy_cb_range()
-        self.fit_xy_cb.refresh_colorbar(fit_cb_range[0], fit_cb_range[1])
+        if fit_cb_range != self._fit_xy_cb_range:
+            self._fit_xy_cb_range = fit_cb_range
+            self.fit_xy_cb.refresh_colorbar(fit_cb_range[0], fit_cb_range[1])
 
     def refresh_fitted_xy_image(self):
         """ Update the current XY image from the logic.
@@ -1865,8 +1781,8 @@ class WidefieldGUI(GUIBase):
             fit_low_centile = self._mw.fit_xy_cb_low_percentile_DoubleSpinBox.value()
             fit_high_centile = self._mw.fit_xy_cb_high_percentile_DoubleSpinBox.value()
 
-            fit_cb_min = np.percentile(self._fitted_image.image, fit_low_centile)
-            fit_cb_max = np.percentile(self._fitted_image.image, fit_high_centile)
+            fit_cb_min, fit_cb_max = self._fast_percentiles(self._fitted_image.image,
+                                                            fit_low_centile, fit_high_centile)
 
         fit_cb_range = [fit_cb_min, fit_cb_max]
 
@@ -1918,176 +1834,215 @@ class WidefieldGUI(GUIBase):
         # Empty reference containers
         self._mw.gen_buttons = dict()
         self._mw.samplo_buttons = dict()
+        # True while a sample and load is running, the generate buttons stay disabled meanwhile
+        self._sampload_busy = False
         self._mw.method_param_widgets = dict()
 
         self._mw.dockWidgetContents_4_grid_layout = self._mw.dockWidgetContents_4.layout()
-
+        self._range_rows = list()
+        # rows taken out by 'Remove Range' are kept hidden here and reused by 'Add Range'
+        self._range_row_pool = list()
+
+        # The GroupBox of a predefined method is only built once the method is selected.
+        # The ranges GroupBox is shared by all sweeping methods and is always built, since
+        # update_parameter and the status handling need the range spinboxes right away.
+        self._pending_method_builders = dict()
+        # GroupBoxes of the methods built so far, keyed by method name
+        self._method_groupboxes = dict()
         method_params = self._widefield_logic.generate_method_params
         for method_name in natural_sort(self._widefield_logic.predefined_generate_methods):
-            
-            # Create the widgets for the predefined methods dialogue
-            # Create GroupBox for the method to reside in
-            groupBox = QtWidgets.QGroupBox(self._mw.dockWidgetContents_4)
-            groupBox.setVisible(False)
-            groupBox.setAlignment(QtCore.Qt.AlignLeft)
-            groupBox.setTitle(method_name)
-            # Create layout within the GroupBox
-            gridLayout = QtWidgets.QGridLayout(groupBox)
-            # Create generate buttons
-            gen_button = QtWidgets.QPushButton(groupBox)
-            gen_button.setText('Generate')
-            gen_button.setObjectName('gen_' + method_name)
-            gen_button.clicked.connect(self.generate_predefined_clicked)
-            samplo_button = QtWidgets.QPushButton(groupBox)
-            samplo_button.setText('GenSampLo')
-            samplo_button.setObjectName('samplo_' + method_name)
-            samplo_button.clicked.connect(self.generate_predefined_clicked)
-            gridLayout.addWidget(gen_button, 0, 0, 1, 1)
-            gridLayout.addWidget(samplo_button, 1, 0, 1, 1)
-            self._mw.gen_buttons[method_name] = gen_button
-            self._mw.samplo_buttons[method_name] = samplo_button
-
-            # run through all parameters of the current method and create the widgets
-            self._mw.method_param_widgets[method_name] = dict()
-            for param_index, (param_name, param) in enumerate(method_params[method_name].items()):
-                    
-                    if param_name == "ranges" and param is True:
-                        # Add grid layout for ranges
-                        ranges_GroupBox = QtWidgets.QGroupBox(self._mw.dockWidgetContents_4)
-                        ranges_GroupBox.setVisible(False)
-                        ranges_GroupBox.setAlignment(QtCore.Qt.AlignLeft)
-                        ranges_GroupBox.setMaximumWidth(900)
-                        ranges_gridLayout = QtWidgets.QGridLayout(ranges_GroupBox)
-                        constraints = self._widefield_logic.get_hw_constraints()
-                        for row in range(self._widefield_logic.ranges):
-                            # start
-                            start_label = QtWidgets.QLabel(ranges_GroupBox)
-                            start_label.setText('Start:')
-                            setattr(self._mw.measurement_control_DockWidget, 'start_label_{}'.format(row), start_label)
-                            start_freq_DoubleSpinBox = ScienDSpinBox(ranges_GroupBox)
-                            start_freq_DoubleSpinBox.setSuffix('Hz')
-                            start_freq_DoubleSpinBox.setMaximum(constraints.max_frequency)
-                            start_freq_DoubleSpinBox.setMinimum(constraints.min_frequency)
-                            start_freq_DoubleSpinBox.setMinimumSize(QtCore.QSize(80, 0))
-                            start_freq_DoubleSpinBox.setValue(self._widefield_logic.mw_starts[row])
-                            start_freq_DoubleSpinBox.setMinimumWidth(75)
-                            start_freq_DoubleSpinBox.setMaximumWidth(100)
-                            setattr(self._mw.measurement_control_DockWidget, 'start_freq_DoubleSpinBox_{}'.format(row),
-                                    start_freq_DoubleSpinBox)
-                            ranges_gridLayout.addWidget(start_label, row, 1, 1, 1)
-                            ranges_gridLayout.addWidget(start_freq_DoubleSpinBox, row, 2, 1, 1)
-                            start_freq_DoubleSpinBox.editingFinished.connect(self.change_sweep_params)
-                            # step
-                            step_label = QtWidgets.QLabel(ranges_GroupBox)
-                            step_label.setText('Step:')
-                            setattr(self._mw.measurement_control_DockWidget, 'step_label_{}'.format(row), step_label)
-                            step_freq_DoubleSpinBox = ScienDSpinBox(ranges_GroupBox)
-                            step_freq_DoubleSpinBox.setSuffix('Hz')
-                            step_freq_DoubleSpinBox.setMaximum(100e9)
-                            step_freq_DoubleSpinBox.setMinimumSize(QtCore.QSize(80, 0))
-                            step_freq_DoubleSpinBox.setValue(self._widefield_logic.mw_steps[row])
-                            step_freq_DoubleSpinBox.setMinimumWidth(75)
-                            step_freq_DoubleSpinBox.setMaximumWidth(100)
-                            step_freq_DoubleSpinBox.editingFinished.connect(self.change_sweep_params)
-                            setattr(self._mw.measurement_control_DockWidget, 'step_freq_DoubleSpinBox_{}'.format(row),
-                                    step_freq_DoubleSpinBox)
-                            ranges_gridLayout.addWidget(step_label, row, 3, 1, 1)
-                            ranges_gridLayout.addWidget(step_freq_DoubleSpinBox, row, 4, 1, 1)
-
-                            # stop
-                            stop_label = QtWidgets.QLabel(ranges_GroupBox)
-                            stop_label.setText('Stop:')
-                            setattr(self._mw.measurement_control_DockWidget, 'stop_label_{}'.format(row), stop_label)
-                            stop_freq_DoubleSpinBox = ScienDSpinBox(ranges_GroupBox)
-                            stop_freq_DoubleSpinBox.setSuffix('Hz')
-                            stop_freq_DoubleSpinBox.setMaximum(constraints.max_frequency)
-                            stop_freq_DoubleSpinBox.setMinimum(constraints.min_frequency)
-                            stop_freq_DoubleSpinBox.setMinimumSize(QtCore.QSize(80, 0))
-                            stop_freq_DoubleSpinBox.setValue(self._widefield_logic.mw_stops[row])
-                            stop_freq_DoubleSpinBox.setMinimumWidth(75)
-                            stop_freq_DoubleSpinBox.setMaximumWidth(100)
-                            stop_freq_DoubleSpinBox.editingFinished.connect(self.change_sweep_params)
-                            setattr(self._mw.measurement_control_DockWidget, 'stop_freq_DoubleSpinBox_{}'.format(row),
-                                    stop_freq_DoubleSpinBox)
-                            ranges_gridLayout.addWidget(stop_label, row, 5, 1, 1)
-                            ranges_gridLayout.addWidget(stop_freq_DoubleSpinBox, row, 6, 1, 1)
-
-                            # on the first row add buttons to add and remove measurement ranges
-                            if row == 0:
-                                add_range_button = QtWidgets.QPushButton(ranges_GroupBox)
-                                add_range_button.setText('Add Range')
-                                add_range_button.setMinimumWidth(75)
-                                add_range_button.setMaximumWidth(100)
-                                if self._widefield_logic.mw_scanmode.name == 'SWEEP':
-                                    add_range_button.setDisabled(True)
-                                add_range_button.clicked.connect(self.add_ranges_gui_elements_clicked)
-                                ranges_gridLayout.addWidget(add_range_button, row, 7, 1, 1)
-                                setattr(self._mw.measurement_control_DockWidget, 'add_range_button',
-                                        add_range_button)
-
-                                remove_range_button = QtWidgets.QPushButton(ranges_GroupBox)
-                                remove_range_button.setText('Remove Range')
-                                remove_range_button.setMinimumWidth(75)
-                                remove_range_button.setMaximumWidth(100)
-                                remove_range_button.clicked.connect(self.remove_ranges_gui_elements_clicked)
-                                ranges_gridLayout.addWidget(remove_range_button, row, 8, 1, 1)
-                                setattr(self._mw.measurement_control_DockWidget, 'remove_range_button',
-                                        remove_range_button)
-
-                        self._mw.fit_range_SpinBox.setMaximum(self._widefield_logic.ranges - 1)
-                        setattr(self._mw.measurement_control_DockWidget, 'ranges_GroupBox', ranges_GroupBox)
-                        self._mw.fit_range_SpinBox.valueChanged.connect(self.change_fit_range)
-                        # (QWidget * widget, int row, int column, Qt::Alignment alignment = Qt::Alignment())
-
-                        self._mw.dockWidgetContents_4_grid_layout.addWidget(ranges_GroupBox, 7, 1, 1, 5)
-                    else:
-                        # create a label for the parameter
-                        param_label = QtWidgets.QLabel(groupBox)
-                        param_label.setText(param_name)
-                        # create proper input widget for the parameter depending on default value type
-                        if type(param) is bool:
-                            input_obj = QtWidgets.QCheckBox(groupBox)
-                            input_obj.setChecked(param)
-                        elif type(param) is float:
-                            input_obj = ScienDSpinBox(groupBox)
-                            if 'amp' in param_name or 'volt' in param_name:
-                                input_obj.setSuffix('V')
-                            elif 'freq' in param_name:
-                                input_obj.setSuffix('Hz')
-                            elif 'time' in param_name or 'period' in param_name or 'tau' in param_name:
-                                input_obj.setSuffix('s')
-                            input_obj.setMinimumSize(QtCore.QSize(80, 0))
-                            input_obj.setValue(param)
-                        elif type(param) is int:
-                            input_obj = ScienSpinBox(groupBox)
-                            input_obj.setValue(param)
-                        elif type(param) is str:
-                            input_obj = QtWidgets.QLineEdit(groupBox)
-                            input_obj.setMinimumSize(QtCore.QSize(80, 0))
-                            input_obj.setText(param)
-                        elif issubclass(type(param), Enum):
-                            input_obj = QtWidgets.QComboBox(groupBox)
-                            for option in type(param):
-                                input_obj.addItem(option.name, option)
-                            input_obj.setCurrentText(param.name)
-                            # Set size constraints
-                            input_obj.setMinimumSize(QtCore.QSize(80, 0))
-                        else:
-                            self.log.error('The predefined method "{0}" has an argument "{1}" which '
-                                        'has no default argument or an invalid type (str, float, '
-                                        'int, bool or Enum allowed)!\nCreation of the viewbox aborted.'
-                                        ''.format('generate_' + method_name, param_name))
-                            continue
-                        # Adjust size policy
-                        input_obj.setMinimumWidth(75)
-                        input_obj.setMaximumWidth(100)
-                        gridLayout.addWidget(param_label, 0, param_index + 1, 1, 1)
-                        gridLayout.addWidget(input_obj, 1, param_index + 1, 1, 1)
-                        self._mw.method_param_widgets[method_name][param_name] = input_obj
-                        # attach the GroupBox widget to the predefined methods widget.
-            setattr(self._mw, method_name + '_GroupBox', groupBox)
-               
-            self._mw.dockWidgetContents_4_grid_layout.addWidget(groupBox,4,1)
+            params = method_params[method_name]
+            if params.get('ranges') is True and not hasattr(self._mw.measurement_control_DockWidget,
+                                                            'ranges_GroupBox'):
+                self._create_ranges_groupbox()
+            self._pending_method_builders[method_name] = partial(self._create_method_groupbox,
+                                                                 method_name, params)
+        return
+
+    def _create_method_groupbox(self, method_name, method_params):
+        """
+        Creates the GroupBox with the generate buttons and parameter widgets of a predefined method
+
+        @param str method_name: name of the predefined method
+        @param dict method_params: default parameters of the method
+        """
+        # Create the widgets for the predefined methods dialogue
+        # Create GroupBox for the method to reside in
+        groupBox = QtWidgets.QGroupBox(self._mw.dockWidgetContents_4)
+        groupBox.setVisible(False)
+        groupBox.setAlignment(QtCore.Qt.AlignLeft)
+        groupBox.setTitle(method_name)
+        # Create layout within the GroupBox
+        gridLayout = QtWidgets.QGridLayout(groupBox)
+        # Create generate buttons
+        gen_button = QtWidgets.QPushButton(groupBox)
+        gen_button.setText('Generate')
+        gen_button.setObjectName('gen_' + method_name)
+        gen_button.clicked.connect(self.generate_predefined_clicked)
+        samplo_button = QtWidgets.QPushButton(groupBox)
+        samplo_button.setText('GenSampLo')
+        samplo_button.setObjectName('samplo_' + method_name)
+        samplo_button.clicked.connect(self.generate_predefined_clicked)
+        gridLayout.addWidget(gen_button, 0, 0, 1, 1)
+        gridLayout.addWidget(samplo_button, 1, 0, 1, 1)
+        # GroupBoxes built during a sample and load have to respect the lockout as well
+        gen_button.setEnabled(not self._sampload_busy)
+        samplo_button.setEnabled(not self._sampload_busy)
+        self._mw.gen_buttons[method_name] = gen_button
+        self._mw.samplo_buttons[method_name] = samplo_button
+
+        # run through all parameters of the current method and create the widgets
+        self._mw.method_param_widgets[method_name] = dict()
+        for param_index, (param_name, param) in enumerate(method_params.items()):
+            if param_name == "ranges" and param is True:
+                # all methods sweeping frequency ranges share the ranges GroupBox built up front
+                continue
+            else:
+                # create a label for the parameter
+                param_label = QtWidgets.QLabel(groupBox)
+                param_label.setText(param_name)
+                # create proper input widget for the parameter depending on default value type
+                if type(param) is bool:
+                    input_obj = QtWidgets.QCheckBox(groupBox)
+                    input_obj.setChecked(param)
+                elif type(param) is float:
+                    input_obj = ScienDSpinBox(groupBox)
+                    suffix = next((unit for keys, unit in _SUFFIX_RULES
+                                   if any(key in param_name for key in keys)), None)
+                    if suffix is not None:
+                        input_obj.setSuffix(suffix)
+                    input_obj.setMinimumSize(QtCore.QSize(80, 0))
+                    input_obj.setValue(param)
+                elif type(param) is int:
+                    input_obj = ScienSpinBox(groupBox)
+                    input_obj.setValue(param)
+                elif type(param) is str:
+                    input_obj = QtWidgets.QLineEdit(groupBox)
+                    input_obj.setMinimumSize(QtCore.QSize(80, 0))
+                    input_obj.setText(param)
+                elif issubclass(type(param), Enum):
+                    input_obj = QtWidgets.QComboBox(groupBox)
+                    for option in type(param):
+                        input_obj.addItem(option.name, option)
+                    input_obj.setCurrentText(param.name)
+                    # Set size constraints
+                    input_obj.setMinimumSize(QtCore.QSize(80, 0))
+                else:
+                    self.log.error('The predefined method "{0}" has an argument "{1}" which '
+                                   'has no default argument or an invalid type (str, float, '
+                                   'int, bool or Enum allowed)!\nCreation of the viewbox aborted.'
+                                   ''.format('generate_' + method_name, param_name))
+                    continue
+                # Adjust size policy
+                input_obj.setMinimumWidth(75)
+                input_obj.setMaximumWidth(100)
+                gridLayout.addWidget(param_label, 0, param_index + 1, 1, 1)
+                gridLayout.addWidget(input_obj, 1, param_index + 1, 1, 1)
+                self._mw.method_param_widgets[method_name][param_name] = input_obj
+                # attach the GroupBox widget to the predefined methods widget.
+        setattr(self._mw, method_name + '_GroupBox', groupBox)
+        self._method_groupboxes[method_name] = groupBox
+
+        self._mw.dockWidgetContents_4_grid_layout.addWidget(groupBox,4,1)
+        return
+
+    def _create_ranges_groupbox(self):
+        """
+        Initializes the GroupBox holding the frequency ranges of the sweep
+        """
+        mcd = self._mw.measurement_control_DockWidget
+        # Add grid layout for ranges
+        ranges_GroupBox = QtWidgets.QGroupBox(self._mw.dockWidgetContents_4)
+        ranges_GroupBox.setVisible(False)
+        ranges_GroupBox.setAlignment(QtCore.Qt.AlignLeft)
+        ranges_GroupBox.setMaximumWidth(900)
+        ranges_gridLayout = QtWidgets.QGridLayout(ranges_GroupBox)
+        constraints = self._hw_constraints
+        mw_starts = self._widefield_logic.mw_starts
+        mw_steps = self._widefield_logic.mw_steps
+        mw_stops = self._widefield_logic.mw_stops
+        for row in range(self._widefield_logic.ranges):
+            range_row = self._create_range_row(ranges_GroupBox, row, constraints,
+                                               mw_starts[row], mw_steps[row], mw_stops[row])
+            self._range_rows.append(range_row)
+
+        # add buttons to add and remove measurement ranges next to the first row
+        add_range_button = QtWidgets.QPushButton(ranges_GroupBox)
+        add_range_button.setText('Add Range')
+        add_range_button.setMinimumWidth(75)
+        add_range_button.setMaximumWidth(100)
+        if self._widefield_logic.mw_scanmode.name == 'SWEEP':
+            add_range_button.setDisabled(True)
+        add_range_button.clicked.connect(self.add_ranges_gui_elements_clicked)
+        ranges_gridLayout.addWidget(add_range_button, 0, 7, 1, 1)
+        setattr(mcd, 'add_range_button', add_range_button)
+
+        remove_range_button = QtWidgets.QPushButton(ranges_GroupBox)
+        remove_range_button.setText('Remove Range')
+        remove_range_button.setMinimumWidth(75)
+        remove_range_button.setMaximumWidth(100)
+        remove_range_button.clicked.connect(self.remove_ranges_gui_elements_clicked)
+        ranges_gridLayout.addWidget(remove_range_button, 0, 8, 1, 1)
+        setattr(mcd, 'remove_range_button', remove_range_button)
+
+        self._mw.fit_range_SpinBox.setMaximum(self._widefield_logic.ranges - 1)
+        setattr(mcd, 'ranges_GroupBox', ranges_GroupBox)
+        self._mw.fit_range_SpinBox.valueChanged.connect(self.change_fit_range)
+        # (QWidget * widget, int row, int column, Qt::Alignment alignment = Qt::Alignment())
+
+        self._mw.dockWidgetContents_4_grid_layout.addWidget(ranges_GroupBox, 7, 1, 1, 5)
+        return
+
+    def _create_range_row(self, groupBox, row, constraints, start, step, stop):
+        """
+        Creates the labels and frequency spinboxes of one range in the given row of the ranges GroupBox
+
+        @param QGroupBox groupBox: the ranges GroupBox
+        @param int row: grid row to put the widgets in
+        @param constraints: microwave constraints limiting the start and stop frequencies
+        @param float start: initial start frequency
+        @param float step: initial step frequency
+        @param float stop: initial stop frequency
+
+        @return dict: widgets keyed by 'start', 'step', 'stop' and '<identifier>_label'
+        """
+        max_frequency = constraints.max_frequency
+        min_frequency = constraints.min_frequency
+        range_row = dict()
+        for identifier, value in (('start', start), ('step', step), ('stop', stop)):
+            label = QtWidgets.QLabel(groupBox)
+            label.setText('{0}:'.format(identifier.capitalize()))
+            freq_DoubleSpinBox = ScienDSpinBox(groupBox)
+            freq_DoubleSpinBox.setSuffix('Hz')
+            if identifier == 'step':
+                freq_DoubleSpinBox.setMaximum(100e9)
+            else:
+                freq_DoubleSpinBox.setMaximum(max_frequency)
+                freq_DoubleSpinBox.setMinimum(min_frequency)
+            freq_DoubleSpinBox.setMinimumSize(QtCore.QSize(80, 0))
+            freq_DoubleSpinBox.setValue(value)
+            freq_DoubleSpinBox.setMinimumWidth(75)
+            freq_DoubleSpinBox.setMaximumWidth(100)
+            range_row[identifier + '_label'] = label
+            range_row[identifier] = freq_DoubleSpinBox
+        self._place_range_row(groupBox, row, range_row)
+        # connect only once the whole row is set up, so building it can not send sweep parameters
+        for identifier in ('start', 'step', 'stop'):
+            range_row[identifier].editingFinished.connect(self.schedule_sweep_params)
+        return range_row
+
+    def _place_range_row(self, groupBox, row, range_row):
+        """
+        Puts the labels and frequency spinboxes of a range row into the grid of the ranges GroupBox
+
+        @param QGroupBox groupBox: the ranges GroupBox
+        @param int row: grid row to put the widgets in
+        @param dict range_row: widgets as returned by _create_range_row
+        """
+        gridLayout = groupBox.layout()
+        for column, identifier in enumerate(('start', 'step', 'stop')):
+            gridLayout.addWidget(range_row[identifier + '_label'], row, 2 * column + 1, 1, 1)
+            gridLayout.addWidget(range_row[identifier], row, 2 * column + 2, 1, 1)
         return
 
     @QtCore.Slot(bool)
@@ -2129,6 +2084,7 @@ class WidefieldGUI(GUIBase):
 
         if sample_and_load:
             # disable buttons
+            self._sampload_busy = True
             for button in self._mw.gen_buttons.values():
                 button.setEnabled(False)
             for button in self._mw.samplo_buttons.values():
@@ -2147,6 +2103,7 @@ class WidefieldGUI(GUIBase):
         # TODO add in sampload busy stuff
         # if not self._pulsedmasterlogic.status_dict['sampload_busy']:
             # Reactivate predefined method buttons
+        self._sampload_busy = False
         for button in self._mw.gen_buttons.values():
             button.setEnabled(True)
         for button in self._mw.samplo_buttons.values():
@@ -2157,11 +2114,21 @@ class WidefieldGUI(GUIBase):
         current_measurement = self._mw.measurement_type_comboBox.currentText()
 
         ranges_groupBox = self._mw.measurement_control_DockWidget.ranges_GroupBox
-        for method_name in self._widefield_logic.generate_methods:
-            groupbox = getattr(self._mw, method_name + '_GroupBox')
-            groupbox.setVisible(method_name == current_measurement)
-
-        method_params = self._widefield_logic.generate_method_params[current_measurement]    
-        ranges_groupBox.setVisible("ranges" in method_params)
-            
+        # swap the method GroupBoxes with a single repaint of the dock contents
+        dock_contents = self._mw.dockWidgetContents_4
+        dock_contents.setUpdatesEnabled(False)
+        try:
+            builder = self._pending_method_builders.pop(current_measurement, None)
+            if builder is not None:
+                builder()
+            if current_measurement not in self._method_groupboxes:
+                self.log.error('No predefined method "{0}" found, its parameters can not be '
+                               'shown.'.format(current_measurement))
+            for method_name, groupbox in self._method_groupboxes.items():
+                groupbox.setVisible(method_name == current_measurement)
+
+            method_params = self._widefield_logic.generate_method_params.get(current_measurement, dict())
+            ranges_groupBox.setVisible("ranges" in method_params)
+        finally:
+            dock_contents.setUpdatesEnabled(True)
         return
\ No newline at end of file
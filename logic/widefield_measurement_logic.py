@@ -843,12 +843,14 @@ class WidefieldMeasurementLogic(GenericLogic):
                     freq_list = np.linspace(mw_start, end_freq, num_steps + 1)
                     # adjust the end frequency in order to have an integer multiple of step size
                     # The master module (i.e. GUI) will be notified about the changed end frequency
-                    final_freq_list.extend(freq_list)
+                    final_freq_list.append(freq_list)
                     used_starts.append(mw_start)
                     used_steps.append(mw_step)
                     used_stops.append(end_freq)
 
-                final_freq_list = np.array(final_freq_list)
+                # join the per range arrays at once instead of boxing every frequency into the list
+                # np.concatenate can not join zero arrays, without ranges the list stays empty
+                final_freq_list = np.concatenate(final_freq_list) if final_freq_list else np.array([])
                 if len(final_freq_list) >= limits.list_maxentries:
                     self.log.error('Number of frequency steps too large for microwave device.')
                     mode, is_running = self._mw_device.get_status()
@@ -1269,29 +1271,27 @@ class WidefieldMeasurementLogic(GenericLogic):
             self.odmr_plot_y2 = np.array([])
         elif self.num_curves == 2:
             #TODO this assumes a specific order, and only plots a single curve (subtracted bg) 
-            data_l = np.zeros((self._widefield_camera.get_size()[0], self._widefield_camera.get_size()[1],int(self.num_imgs/2)))
-            data_bg= np.zeros((self._widefield_camera.get_size()[0], self._widefield_camera.get_size()[1],int(self.num_imgs/2)))
-            for i in range(int(self.num_imgs/2)):
-                data_l[:,:,i] = self.odmr_raw_data[:,:,2*i]
-                data_bg[:,:,i] = self.odmr_raw_data[:,:,2*i+1]
-            self.odmr_plot_y = data_l[self.plot_pixel_x, self.plot_pixel_y,:] - data_bg[self.plot_pixel_x, self.plot_pixel_y,:]
-            # self.odmr_plot_y1 = data_l[self.plot_pixel_x, self.plot_pixel_y,:]
-            # self.odmr_plot_y2 = data_bg[self.plot_pixel_x, self.plot_pixel_y,:]
+            # Only the trace of the plotted pixel is needed, so de-interleave that instead of the whole stack
+            num_points = int(self.num_imgs/2)
+            pixel_trace = self.odmr_raw_data[self.plot_pixel_x, self.plot_pixel_y, :2*num_points].astype(float)
+            data_l = pixel_trace[0::2]
+            data_bg = pixel_trace[1::2]
+            self.odmr_plot_y = data_l - data_bg
+            # self.odmr_plot_y1 = data_l
+            # self.odmr_plot_y2 = data_bg
             self.odmr_plot_y1 = np.array([])
             self.odmr_plot_y2 = np.array([])
         elif self.num_curves == 3:
             # TODO assumes specific order of pulsing, currently only plotting l
-            data_l = np.zeros((self._widefield_camera.get_size()[0], self._widefield_camera.get_size()[1],int(self.num_imgs/3)))
-            data_u = np.zeros((self._widefield_camera.get_size()[0], self._widefield_camera.get_size()[1],int(self.num_imgs/3)))
-            data_bg= np.zeros((self._widefield_camera.get_size()[0], self._widefield_camera.get_size()[1],int(self.num_imgs/3)))
-            for i in range(int(self.num_imgs/3)):
-                data_l[:,:,i] = self.odmr_raw_data[:,:,3*i]
-                data_bg[:,:,i] = self.odmr_raw_data[:,:,3*i+1]
-                data_u[:,:,i] = self.odmr_raw_data[:,:,3*i+2]
-            # self.odmr_plot_y = data_l[self.plot_pixel_x, self.plot_pixel_y,:] - data_bg[self.plot_pixel_x, self.plot_pixel_y,:]
-            self.odmr_plot_y = data_l[self.plot_pixel_x, self.plot_pixel_y,:]
-            self.odmr_plot_y1 = data_bg[self.plot_pixel_x, self.plot_pixel_y,:]
-            self.odmr_plot_y2 = data_u[self.plot_pixel_x, self.plot_pixel_y,:]
+            num_points = int(self.num_imgs/3)
+            pixel_trace = self.odmr_raw_data[self.plot_pixel_x, self.plot_pixel_y, :3*num_points].astype(float)
+            data_l = pixel_trace[0::3]
+            data_bg = pixel_trace[1::3]
+            data_u = pixel_trace[2::3]
+            # self.odmr_plot_y = data_l - data_bg
+            self.odmr_plot_y = data_l
+            self.odmr_plot_y1 = data_bg
+            self.odmr_plot_y2 = data_u
         else: 
             self.log.warning('Number of curves exceeds 3')
 
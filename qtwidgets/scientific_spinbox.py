@@ -229,6 +229,7 @@ class ScienDSpinBox(QtWidgets.QAbstractSpinBox):
         self.__singleStep = D('0.1')  # must be precise Decimal always, no conversion from float
         self.__minimalStep = D(0)  # must be precise Decimal always, no conversion from float
         self.__cached_value = None  # a temporary variable for restore functionality
+        self.__value_pending = False  # typed value not yet announced (keyboardTracking disabled)
         self._dynamic_stepping = True
         self._dynamic_precision = True
         self._assumed_unit_prefix = None  # To assume one prefix. This is only used if no prefix would be out of range
@@ -341,11 +342,23 @@ class ScienDSpinBox(QtWidgets.QAbstractSpinBox):
 
         if float(value) != self.value():
             self.__value = value
-            self.valueChanged.emit(self.value())
+            if self.keyboardTracking():
+                self.valueChanged.emit(self.value())
+            else:
+                self.__value_pending = True
         else:
             self.__value = value
         self._is_valid = True
 
+    def __emit_pending_value(self):
+        """
+        Announce a value typed in while keyboardTracking is disabled once editing has finished,
+        i.e. upon pressing enter/return or losing focus.
+        """
+        if self.__value_pending:
+            self.__value_pending = False
+            self.valueChanged.emit(self.value())
+
     def value(self):
         """
         Getter method to obtain the current value as float.
@@ -379,6 +392,8 @@ class ScienDSpinBox(QtWidgets.QAbstractSpinBox):
             self._is_valid = False
             return
 
+        # a programmatic value replaces a typed value that was not announced yet
+        self.__value_pending = False
         value, in_range = self.check_range(value)
 
         if self.__value != value or not self.is_valid:
@@ -641,6 +656,7 @@ class ScienDSpinBox(QtWidgets.QAbstractSpinBox):
         if event.key() == QtCore.Qt.Key_Escape:
             if self.__cached_value is not None:
                 self.__value = self.__cached_value
+                self.__value_pending = False
                 self.valueChanged.emit(self.value())
             self.clearFocus()  # This will also trigger editingFinished
             return
@@ -648,6 +664,7 @@ class ScienDSpinBox(QtWidgets.QAbstractSpinBox):
         # Update display upon pressing enter/return before processing the event in the default way.
         if event.key() == QtCore.Qt.Key_Enter or event.key() == QtCore.Qt.Key_Return:
             self.update_display()
+            self.__emit_pending_value()
 
         if (QtCore.Qt.ControlModifier | QtCore.Qt.MetaModifier) & event.modifiers():
             super().keyPressEvent(event)
@@ -697,6 +714,7 @@ class ScienDSpinBox(QtWidgets.QAbstractSpinBox):
 
     def focusOutEvent(self, event):
         self.update_display()
+        self.__emit_pending_value()
         super().focusOutEvent(event)
         return
 
@@ -1033,6 +1051,7 @@ class ScienSpinBox(QtWidgets.QAbstractSpinBox):
         self.__singleStep = 1
         self.__minimalStep = 1
         self.__cached_value = None  # a temporary variable for restore functionality
+        self.__value_pending = False  # typed value not yet announced (keyboardTracking disabled)
         self._dynamic_stepping = True
         self.disable_wheel = False
         self.validator = IntegerValidator()
@@ -1081,6 +1100,18 @@ class ScienSpinBox(QtWidgets.QAbstractSpinBox):
 
         if value != self.value():
             self.__value = value
+            if self.keyboardTracking():
+                self.valueChanged.emit(self.value())
+            else:
+                self.__value_pending = True
+
+    def __emit_pending_value(self):
+        """
+        Announce a value typed in while keyboardTracking is disabled once editing has finished,
+        i.e. upon pressing enter/return or losing focus.
+        """
+        if self.__value_pending:
+            self.__value_pending = False
             self.valueChanged.emit(self.value())
 
     def value(self):
@@ -1102,6 +1133,8 @@ class ScienSpinBox(QtWidgets.QAbstractSpinBox):
 
         value = int(value)
 
+        # a programmatic value replaces a typed value that was not announced yet
+        self.__value_pending = False
         value, in_range = self.check_range(value)
 
         if self.__value != value:
@@ -1285,12 +1318,14 @@ class ScienSpinBox(QtWidgets.QAbstractSpinBox):
         if event.key() == QtCore.Qt.Key_Escape:
             if self.__cached_value is not None:
                 self.__value = self.__cached_value
+                self.__value_pending = False
                 self.valueChanged.emit(self.value())
             self.clearFocus()  # This will also trigger editingFinished
 
         # Update display upon pressing enter/return before processing the event in the default way.
         if event.key() == QtCore.Qt.Key_Enter or event.key() == QtCore.Qt.Key_Return:
             self.update_display()
+            self.__emit_pending_value()
 
         if (QtCore.Qt.ControlModifier | QtCore.Qt.MetaModifier) & event.modifiers():
             super().keyPressEvent(event)
@@ -1342,6 +1377,7 @@ class ScienSpinBox(QtWidgets.QAbstractSpinBox):
 
     def focusOutEvent(self, event):
         self.update_display()
+        self.__emit_pending_value()
         super().focusOutEvent(event)
         return
 